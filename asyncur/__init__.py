@@ -1,15 +1,23 @@
-import importlib.metadata as importlib_metadata
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
 from .aio import gather, run, run_async, start_tasks, wait_for
-from .client import AsyncRedis
+from .cache import alru_cache
 from .timing import timeit
 from .utils import AttrDict
 
-__version__ = importlib_metadata.version(__name__)
+if TYPE_CHECKING:  # pragma: no cover
+    from . import xls as xls
+    from .client import AsyncRedis, AsyncRedisCluster
+
+    __version__: str
+
 __all__ = (
     "__version__",
     "AsyncRedis",
+    "AsyncRedisCluster",
     "AttrDict",
+    "alru_cache",
     "run",
     "run_async",
     "gather",
@@ -17,3 +25,23 @@ __all__ = (
     "timeit",
     "wait_for",
 )
+
+
+def __getattr__(name: str) -> Any:
+    # Lazy load attributes that slow down `import asyncur` (PEP 562)
+    if name in ("AsyncRedis", "AsyncRedisCluster"):
+        value = getattr(import_module(".client", __name__), name)
+    elif name == "xls":
+        value = import_module(".xls", __name__)
+    elif name == "__version__":
+        import importlib.metadata as importlib_metadata
+
+        value = importlib_metadata.version(__name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__, "xls"})
@@ -1,12 +1,42 @@
+import atexit
+import functools
+import importlib.util
+import math
+import os
 import sys
+import threading
+import time
 import warnings
-from contextlib import asynccontextmanager
-from typing import Any, Awaitable, Callable, Coroutine, Sequence, TypeVar
+from contextlib import (
+    AbstractAsyncContextManager,
+    ExitStack,
+    asynccontextmanager,
+    contextmanager,
+)
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Iterator,
+    Literal,
+    NamedTuple,
+    Sequence,
+    TypeVar,
+)
 
 import anyio
 
 from .exceptions import ParamsError
 
+if TYPE_CHECKING:  # pragma: no cover
+    from anyio.from_thread import BlockingPortal
+    from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
+
+    from .supervisor import Supervisor
+
 if sys.version_info >= (3, 11):
     from typing import TypeVarTuple, Unpack
 else:
@@ -31,8 +61,106 @@ def ensure_afunc(
     return do_await
 
 
+def resolve_backend(
+    backend: str, backend_options: dict[str, Any] | None = None
+) -> tuple[str, dict[str, Any] | None]:
+    """Convert backend `auto` to be asyncio, and enable uvloop if it is installed
+
+    Usage::
+        >>> resolve_backend('trio')
+        ('trio', None)
+        >>> resolve_backend('auto')  # doctest: +SKIP
+        ('asyncio', {'use_uvloop': True})
+    """
+    if backend != "auto":
+        return backend, backend_options
+    options = dict(backend_options or {})
+    if "use_uvloop" not in options and importlib.util.find_spec("uvloop"):
+        options["use_uvloop"] = True
+    return "asyncio", options
+
+
+# Portal of `blocking_portal`, per thread so that threaded workers do not
+# override each other, and the process level one of `start_portal` as fallback
+_local = threading.local()
+_portal: "BlockingPortal | None" = None
+_portal_stack: ExitStack | None = None
+_portal_lock = threading.Lock()
+
+
+def _current_portal() -> "BlockingPortal | None":
+    return getattr(_local, "portal", None) or _portal
+
+
+@contextmanager
+def blocking_portal(
+    backend: str = "asyncio", backend_options: dict[str, Any] | None = None
+) -> Iterator["BlockingPortal"]:
+    """Keep an event loop running in a background thread.
+
+    `run`/`run_async` called inside it (by the same thread) will send coroutines to that loop,
+    instead of creating a new event loop for each call (the `backend` and
+    `backend_options` of them are ignored), so connection pools (e.g.: the
+    one of a global AsyncRedis instance) can be reused between calls.
+    Use backend `auto` to run with uvloop if it is installed.
+
+    Usage::
+        >>> async def afunc(n=1):
+        ...     return n
+        ...
+        >>> with blocking_portal():
+        ...     [run(afunc, i) for i in range(3)]
+        [0, 1, 2]
+    """
+    from anyio.from_thread import start_blocking_portal
+
+    backend, backend_options = resolve_backend(backend, backend_options)
+    with start_blocking_portal(backend, backend_options) as portal:
+        previous, _local.portal = getattr(_local, "portal", None), portal
+        try:
+            yield portal
+        finally:
+            _local.portal = previous
+
+
+def start_portal(
+    backend: str = "asyncio", backend_options: dict[str, Any] | None = None
+) -> "BlockingPortal":
+    """Start a process level `blocking_portal` if not started, it will be stopped
+    by `stop_portal` or at exit. Useful for sync workers such as celery/django.
+    It is used by all threads that are not inside a `blocking_portal`.
+    """
+    from anyio.from_thread import start_blocking_portal
+
+    global _portal, _portal_stack
+    with _portal_lock:
+        if _portal is None:
+            backend, backend_options = resolve_backend(backend, backend_options)
+            stack = ExitStack()
+            _portal = stack.enter_context(
+                start_blocking_portal(backend, backend_options)
+            )
+            _portal_stack = stack
+            atexit.register(stop_portal)
+        return _portal
+
+
+def stop_portal() -> None:
+    """Stop the portal that started by `start_portal`"""
+    global _portal, _portal_stack
+    with _portal_lock:
+        if _portal_stack is None:
+            return
+        stack, _portal, _portal_stack = _portal_stack, None, None
+        atexit.unregister(stop_portal)
+    stack.close()
+
+
 def run_async(
     coro: Coroutine[None, None, T_Retval] | Callable[..., Awaitable[T_Retval]],
+    *,
+    backend: str = "asyncio",
+    backend_options: dict[str, Any] | None = None,
 ) -> T_Retval:
     """Compare with anyio.run and asyncio.run
 
@@ -44,8 +172,15 @@ def run_async(
         1
         >>> run_async(afunc(2))  # get the same result as: await afunc(2)
         2
+        >>> run_async(afunc, backend='auto')  # use uvloop if it is installed
+        1
     """
-    return anyio.run(ensure_afunc(coro))
+    if (portal := _current_portal()) is not None:
+        return portal.call(ensure_afunc(coro))
+    backend, backend_options = resolve_backend(backend, backend_options)
+    return anyio.run(
+        ensure_afunc(coro), backend=backend, backend_options=backend_options
+    )
 
 
 def run(
@@ -57,15 +192,43 @@ def run(
     backend: str = "asyncio",
     backend_options: dict[str, Any] | None = None,
 ) -> T_Retval:
+    """Similar like anyio.run, but func can be a coroutine,
+    and backend can be `auto` to use uvloop if it is installed.
+    """
+    backend, backend_options = resolve_backend(backend, backend_options)
+    portal = _current_portal()
     if not callable(func):
 
         async def do_await() -> T_Retval:
             return await func
 
+        if portal is not None:
+            return portal.call(do_await)
         return anyio.run(do_await, backend=backend, backend_options=backend_options)
+    if portal is not None:
+        return portal.call(func, *args)
     return anyio.run(func, *args, backend=backend, backend_options=backend_options)
 
 
+async def run_with(limiter: AbstractAsyncContextManager, coro: Coroutine) -> Any:
+    """Await coroutine inside `async with limiter`"""
+    async with limiter:
+        return await coro
+
+
+class _TimedOut:
+    """Placeholder of the coroutines that not finished before timeout"""
+
+    def __repr__(self) -> str:
+        return "TIMED_OUT"
+
+    def __bool__(self) -> bool:
+        return False
+
+
+TIMED_OUT: Any = _TimedOut()
+
+
 async def bulk_gather(
     coros: Sequence[Coroutine],
     batch_size=0,
@@ -73,6 +236,8 @@ async def bulk_gather(
     raises=True,
     *,
     limit: int | None = None,
+    limiter: AbstractAsyncContextManager | None = None,
+    timeout: int | float | None = None,
 ) -> tuple:
     """Similar like `asyncio.gather`, if batch_size is not zero, running tasks will CapacityLimiter({batch_size}).
 
@@ -82,16 +247,26 @@ async def bulk_gather(
         else use anyio.CapacityLimiter to limit task number.
     :param raises: if True, raise Exception when coroutine failed, else return None.
     :param limit: (deprecated) only leave it here to compare with old version.
+    :param limiter: extra async context manager that each coroutine runs inside,
+        e.g.: `asyncur.limiter.RedisRateLimiter` to share rate limit across processes.
+    :param timeout: seconds for the whole batch, coroutines that not finished in time
+        will be cancelled, and their results will be `TIMED_OUT` instead of raising.
     """
+    origin = coros
+    if limiter is not None:
+        coros = [run_with(limiter, coro) for coro in coros]
     total = len(coros)
-    results = [None] * total
+    results: list = [None] * total
+    finished = [False] * total
 
     async def runner(_coro, _i) -> None:
         results[_i] = await _coro
+        finished[_i] = True
 
     async def limited_runner(_coro, _i, _limiter) -> None:
         async with _limiter:
             results[_i] = await _coro
+            finished[_i] = True
 
     try:
         if limit is not None:
@@ -106,35 +281,259 @@ async def bulk_gather(
                     )
             else:
                 batch_size = limit
-        if batch_size:
-            if wait_last:
-                for start in range(0, total, batch_size):
+        with anyio.move_on_after(timeout) as scope:
+            if batch_size:
+                if wait_last:
+                    for start in range(0, total, batch_size):
+                        async with anyio.create_task_group() as tg:
+                            for index, coro in enumerate(
+                                coros[start : start + batch_size]
+                            ):
+                                tg.start_soon(runner, coro, start + index)
+                else:
+                    capacity = anyio.CapacityLimiter(batch_size)
                     async with anyio.create_task_group() as tg:
-                        for index, coro in enumerate(coros[start : start + batch_size]):
-                            tg.start_soon(runner, coro, start + index)
+                        for i, coro in enumerate(coros):
+                            tg.start_soon(limited_runner, coro, i, capacity)
             else:
-                limiter = anyio.CapacityLimiter(batch_size)
                 async with anyio.create_task_group() as tg:
                     for i, coro in enumerate(coros):
-                        tg.start_soon(limited_runner, coro, i, limiter)
-        else:
-            async with anyio.create_task_group() as tg:
-                for i, coro in enumerate(coros):
-                    tg.start_soon(runner, coro, i)
+                        tg.start_soon(runner, coro, i)
     except ExceptionGroup as e:
         if raises:
             raise e.exceptions[0]
 
+    if scope.cancelled_caught:
+        for i, ok in enumerate(finished):
+            if not ok:
+                results[i] = TIMED_OUT
+                # Avoid 'never awaited' warning for the ones that not started
+                coros[i].close()
+                origin[i].close()
+    return tuple(results)
+
+
+async def gather(*coros: Coroutine, timeout: int | float | None = None) -> tuple:
+    """Similar like asyncio.gather
+
+    :param timeout: seconds to wait, results of unfinished coroutines are `TIMED_OUT`
+    """
+    return await bulk_gather(coros, timeout=timeout)
+
+
+def run_chunk(func: Callable[[Any], T_Retval], chunk: Sequence) -> list[T_Retval]:
+    """Call func with each item of the chunk in a worker thread or process"""
+    return [func(item) for item in chunk]
+
+
+async def bulk_run_sync(
+    func: Callable[[Any], T_Retval],
+    items: Sequence,
+    workers: int | None = None,
+    mode: Literal["thread", "process"] = "thread",
+    raises=True,
+    *,
+    chunk_size: int | None = None,
+) -> tuple:
+    """Similar like `bulk_gather`, but call sync function with each item
+    in worker threads or processes, for CPU-bound or blocking work.
+
+    Usage::
+        >>> import hashlib
+        >>> def sha256(data: bytes) -> str:
+        ...     return hashlib.sha256(data).hexdigest()
+        ...
+        >>> await bulk_run_sync(sha256, [b'a', b'b'], mode='process')
+        ('ca978112...', '3e23e816...')
+
+    :param func: sync function, must be picklable (module level) for process mode.
+    :param items: arguments to call func with one by one
+    :param workers: max number of running threads or processes,
+        default to anyio's default thread limiter or cpu count.
+    :param mode: run in `thread` or `process`
+    :param raises: if True, raise Exception when func failed,
+        else return None for the failed and cancelled ones.
+    :param chunk_size: number of items sent to a worker at once, to amortize
+        the pickling overhead. Default to spread items into 4 chunks per worker.
+    """
+    if mode == "thread":
+        from anyio import to_thread
+
+        run_sync: Callable[..., Awaitable] = to_thread.run_sync
+    elif mode == "process":
+        from anyio import to_process
+
+        run_sync = functools.partial(to_process.run_sync, cancellable=True)
+    else:
+        raise ParamsError(f"Invalid value with {mode=}")
+    total = len(items)
+    limiter = anyio.CapacityLimiter(workers) if workers else None
+    if not chunk_size:
+        count = workers or (os.cpu_count() or 1)
+        chunk_size = max(1, math.ceil(total / (count * 4)))
+    results: list = [None] * total
+
+    async def runner(_start: int) -> None:
+        chunk = items[_start : _start + chunk_size]
+        results[_start : _start + len(chunk)] = await run_sync(
+            run_chunk, func, chunk, limiter=limiter
+        )
+
+    try:
+        async with anyio.create_task_group() as tg:
+            for start in range(0, total, chunk_size):
+                tg.start_soon(runner, start)
+    except ExceptionGroup as e:
+        if raises:
+            raise e.exceptions[0]
     return tuple(results)
 
 
-async def gather(*coros: Coroutine) -> tuple:
-    """Similar like asyncio.gather"""
-    return await bulk_gather(coros)
+class Progress(NamedTuple):
+    total: int
+    done: int
+    failed: int
+    rate: float  # finished coroutines per second
+    eta: float  # estimated seconds to finish the rest
+
+
+class _Completed:
+    """Async iterator of (index, result_or_exception), see `as_completed`"""
+
+    def __init__(
+        self,
+        receive: "MemoryObjectReceiveStream",
+        total: int,
+        progress: Callable[[Progress], Any] | None,
+        interval: int | float,
+    ) -> None:
+        self.receive = receive
+        self.total = total
+        self.progress = progress
+        self.interval = interval
+        self.done = self.failed = 0
+        self.start = self.report_at = time.monotonic()
+
+    def __aiter__(self) -> "_Completed":
+        return self
+
+    async def __anext__(self) -> tuple[int, Any]:
+        try:
+            i, value = await self.receive.receive()
+        except (anyio.EndOfStream, anyio.ClosedResourceError):
+            raise StopAsyncIteration from None
+        if isinstance(value, Exception):
+            self.failed += 1
+        else:
+            self.done += 1
+        if self.progress is not None:
+            finished = self.done + self.failed
+            if finished == self.total or self.elapsed() >= self.interval:
+                self.report()
+        return i, value
+
+    def elapsed(self) -> float:
+        """Seconds since last progress report"""
+        return time.monotonic() - self.report_at
+
+    def report(self) -> None:
+        if self.progress is None:
+            return
+        self.report_at = now = time.monotonic()
+        finished = self.done + self.failed
+        rate = finished / (now - self.start or 1e-9)
+        eta = (self.total - finished) / rate if rate else float("inf")
+        self.progress(Progress(self.total, self.done, self.failed, rate, eta))
+
+    async def tick(self) -> None:
+        """Report progress on time even when no coroutine finished for long"""
+        while self.done + self.failed < self.total:
+            await anyio.sleep(max(self.interval - self.elapsed(), 0))
+            if self.done + self.failed < self.total and (
+                self.elapsed() >= self.interval
+            ):
+                self.report()
+
+
+@asynccontextmanager
+async def as_completed(
+    coros: Sequence[Coroutine],
+    batch_size=0,
+    *,
+    progress: Callable[[Progress], Any] | None = None,
+    interval: int | float = 1,
+) -> AsyncIterator[AsyncIterator[tuple[int, Any]]]:
+    """Similar like `asyncio.as_completed`, iterate (index, result_or_exception)
+    as soon as each coroutine finished, so results can be consumed (and released)
+    before all coroutines are done. The rest coroutines are cancelled when
+    leaving the `async with` block, e.g.: break early or raise in the loop.
+
+    Usage::
+        >>> async with as_completed(coros, 100, progress=print) as results:
+        ...     async for index, result in results:
+        ...         if isinstance(result, Exception):
+        ...             ...
+
+    :param coros: Coroutines
+    :param batch_size: running tasks limit number, set 0 to be unlimit.
+    :param progress: function to receive `Progress` every `interval` seconds
+        (even if no coroutine finished in it) and when all coroutines finished.
+    :param interval: seconds between two progress reports.
+    :raises ParamsError: when `interval` is not positive with `progress`
+    """
+    if progress is not None and interval <= 0:
+        raise ParamsError(f"Invalid value with {interval=}")
+    total = len(coros)
+    limiter = anyio.CapacityLimiter(batch_size) if batch_size else None
+
+    async def runner(_coro, _i, _send: "MemoryObjectSendStream") -> None:
+        async with _send:
+            if limiter is None:
+                value = await _capture(_coro)
+                await _send.send((_i, value))
+            else:
+                # Hold the limiter until result is received to bound memory
+                async with limiter:
+                    value = await _capture(_coro)
+                    await _send.send((_i, value))
+
+    send: "MemoryObjectSendStream"
+    send, receive = anyio.create_memory_object_stream(batch_size or max(total, 1))
+    try:
+        # The task group lives in the task of caller, not in a generator
+        async with anyio.create_task_group() as tg, receive:
+            async with send:
+                for i, coro in enumerate(coros):
+                    tg.start_soon(runner, coro, i, send.clone())
+            completed = _Completed(receive, total, progress, interval)
+            if progress is not None:
+                tg.start_soon(completed.tick)
+            try:
+                yield completed
+            finally:
+                tg.cancel_scope.cancel()
+    except ExceptionGroup as e:
+        # Only the body of `async with` can raise, as runners capture errors
+        raise e.exceptions[0]
+    finally:
+        for coro in coros:
+            # Avoid "never awaited" warnings of the cancelled ones
+            coro.close()
+
+
+async def _capture(coro: Coroutine) -> Any:
+    try:
+        return await coro
+    except Exception as e:
+        return e
 
 
 @asynccontextmanager
-async def start_tasks(coro: Coroutine | Callable, *more: Coroutine | Callable):
+async def start_tasks(
+    coro: Coroutine | Callable,
+    *more: Coroutine | Callable,
+    supervisor: "Supervisor | None" = None,
+):
     """Make it easy to convert asyncio.create_task
 
     Usage:
@@ -149,11 +548,17 @@ async def start_tasks(coro: Coroutine | Callable, *more: Coroutine | Callable):
         async def lifespan(app):
             async with start_tasks(startup()):
                 yield
+
+    :param supervisor: restart the tasks by its policy when crashed or hung,
+        instead of failing the whole group, see `asyncur.supervisor.Supervisor`.
+        Tasks should be async functions rather than coroutines in this mode.
     """
+    tasks = [coro, *more]
+    if supervisor is not None:
+        tasks = [supervisor.task(c) for c in tasks]  # type:ignore[arg-type]
     async with anyio.create_task_group() as tg:
         with anyio.CancelScope(shield=True):
-            tg.start_soon(ensure_afunc(coro))
-            for c in more:
+            for c in tasks:
                 tg.start_soon(ensure_afunc(c))
             try:
                 yield
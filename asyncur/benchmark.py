@@ -0,0 +1,125 @@
+"""Compare event loop backends with the workloads of asyncur helpers
+
+Usage::
+    python -m asyncur.benchmark
+    python -m asyncur.benchmark --tasks 100000 --backends asyncio trio
+"""
+
+import argparse
+import importlib.util
+import time
+from typing import Any
+
+import anyio
+
+from .aio import bulk_gather, run, start_tasks, wait_for
+
+BACKENDS: dict[str, tuple[str, dict[str, Any] | None]] = {
+    "asyncio": ("asyncio", None),
+    "asyncio+uvloop": ("asyncio", {"use_uvloop": True}),
+    "trio": ("trio", None),
+}
+
+
+def is_available(name: str) -> bool:
+    if name == "asyncio+uvloop":
+        return importlib.util.find_spec("uvloop") is not None
+    if name == "trio":
+        return importlib.util.find_spec("trio") is not None
+    return name in BACKENDS
+
+
+async def tick() -> None:
+    await anyio.sleep(0)
+
+
+async def bench_gather(total: int, batch_size: int) -> float:
+    """Tasks per second of `bulk_gather`"""
+    start = time.perf_counter()
+    await bulk_gather([tick() for _ in range(total)], batch_size)
+    return total / (time.perf_counter() - start)
+
+
+async def bench_wait_for(total: int) -> float:
+    """Calls per second of `wait_for`"""
+    start = time.perf_counter()
+    for _ in range(total):
+        await wait_for(tick(), 10)
+    return total / (time.perf_counter() - start)
+
+
+async def bench_latency(total: int, background: int) -> tuple[float, float]:
+    """Scheduling latency (mean, p99) of `sleep(0)` in seconds,
+    while `background` tasks are busy in `start_tasks`
+    """
+
+    async def busy() -> None:
+        while True:
+            await anyio.sleep(0)
+
+    costs = []
+    async with start_tasks(busy, *[busy for _ in range(background - 1)]):
+        for _ in range(total):
+            start = time.perf_counter()
+            await anyio.sleep(0)
+            costs.append(time.perf_counter() - start)
+    costs.sort()
+    return sum(costs) / total, costs[int(total * 0.99) - 1]
+
+
+async def bench(tasks: int, batch_size: int, background: int) -> dict[str, float]:
+    mean, p99 = await bench_latency(max(tasks // 100, 100), max(background, 1))
+    return {
+        "gather tasks/s": await bench_gather(tasks, 0),
+        "bulk_gather tasks/s": await bench_gather(tasks, batch_size),
+        "wait_for calls/s": await bench_wait_for(max(tasks // 10, 1)),
+        "latency mean(us)": mean * 1e6,
+        "latency p99(us)": p99 * 1e6,
+    }
+
+
+def benchmark(
+    backends: list[str] | None = None,
+    tasks: int = 10_000,
+    batch_size: int = 100,
+    background: int = 100,
+) -> dict[str, dict[str, float]]:
+    """Run the same workloads with each available backend"""
+    results = {}
+    for name in backends or list(BACKENDS):
+        if not is_available(name):
+            continue
+        backend, options = BACKENDS[name]
+        results[name] = run(
+            bench,
+            tasks,
+            batch_size,
+            background,
+            backend=backend,
+            backend_options=options,
+        )
+    return results
+
+
+def show(results: dict[str, dict[str, float]]) -> None:
+    if not results:
+        print("No available backend")
+        return
+    columns = list(next(iter(results.values())))
+    print("backend".ljust(16), *(c.rjust(20) for c in columns))
+    for name, values in results.items():
+        print(name.ljust(16), *(f"{values[c]:,.1f}".rjust(20) for c in columns))
+
+
+def main() -> None:  # pragma: no cover
+    parser = argparse.ArgumentParser(description="Compare event loop backends")
+    parser.add_argument("--tasks", type=int, default=10_000)
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--background", type=int, default=100)
+    parser.add_argument("--backends", nargs="*", choices=list(BACKENDS))
+    args = parser.parse_args()
+    show(benchmark(args.backends, args.tasks, args.batch_size, args.background))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+import functools
+import time
+from collections import OrderedDict
+from types import MethodType
+from typing import Any, Awaitable, Callable, Generic, NamedTuple, TypeVar, overload
+
+import anyio
+
+from .exceptions import ParamsError
+
+T_Retval = TypeVar("T_Retval")
+_KW_MARK = object()
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int | None
+    currsize: int
+
+
+class _Flight:
+    """Result of the in-flight call that shared by concurrent callers"""
+
+    __slots__ = ("event", "done", "result", "error")
+
+    def __init__(self) -> None:
+        self.event = anyio.Event()
+        self.done = False
+        self.result: Any = None
+        self.error: Exception | None = None
+
+
+class AsyncLRUCache(Generic[T_Retval]):
+    """Cache results of coroutine function, see `alru_cache`"""
+
+    def __init__(
+        self,
+        func: Callable[..., Awaitable[T_Retval]],
+        maxsize: int | None = 128,
+        ttl: int | float | None = None,
+        typed: bool = False,
+    ) -> None:
+        if maxsize is not None and maxsize < 0:
+            raise ParamsError(f"Invalid value with {maxsize=}")
+        if ttl is not None and ttl <= 0:
+            raise ParamsError(f"Invalid value with {ttl=}")
+        functools.update_wrapper(self, func)
+        self.func = func
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.typed = typed
+        # key -> (expire time, result)
+        self._cache: OrderedDict[Any, tuple[float, T_Retval]] = OrderedDict()
+        self._flights: dict[Any, _Flight] = {}
+        self.hits = self.misses = self.evictions = 0
+
+    def make_key(self, args: tuple, kw: dict) -> Any:
+        key: tuple = args
+        if kw:
+            key += (_KW_MARK, *kw.items())
+        if self.typed:
+            key += tuple(type(v) for v in args)
+            key += tuple(type(v) for v in kw.values())
+        elif len(key) == 1 and type(key[0]) in (int, str):
+            return key[0]
+        return key
+
+    def _get(self, key: Any) -> tuple[bool, Any]:
+        try:
+            expire_at, result = self._cache[key]
+        except KeyError:
+            return False, None
+        if expire_at < time.monotonic():
+            del self._cache[key]
+            self.evictions += 1
+            return False, None
+        self._cache.move_to_end(key)
+        return True, result
+
+    def _set(self, key: Any, result: T_Retval) -> None:
+        if self.maxsize == 0:
+            return
+        expire_at = time.monotonic() + self.ttl if self.ttl else float("inf")
+        self._cache[key] = (expire_at, result)
+        self._cache.move_to_end(key)
+        if self.maxsize is not None:
+            while len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+                self.evictions += 1
+
+    async def __call__(self, *args, **kw) -> T_Retval:
+        key = self.make_key(args, kw)
+        while True:
+            found, result = self._get(key)
+            if found:
+                self.hits += 1
+                return result
+            if (flight := self._flights.get(key)) is None:
+                break
+            # Same call is in flight, wait for its result instead of calling again
+            await flight.event.wait()
+            if flight.done:
+                self.hits += 1
+                return flight.result
+            if flight.error is not None:
+                raise flight.error
+            # The caller of the flight was cancelled, try to be the new one
+        self.misses += 1
+        flight = self._flights[key] = _Flight()
+        try:
+            result = await self.func(*args, **kw)
+        except Exception as e:
+            flight.error = e
+            raise
+        else:
+            flight.result, flight.done = result, True
+            self._set(key, result)
+            return result
+        finally:
+            del self._flights[key]
+            flight.event.set()
+
+    def __get__(self, instance: Any, owner: type | None = None) -> Any:
+        # Support to decorate methods
+        return self if instance is None else MethodType(self, instance)
+
+    def cache_info(self) -> CacheInfo:
+        return CacheInfo(
+            self.hits, self.misses, self.evictions, self.maxsize, len(self._cache)
+        )
+
+    def cache_clear(self) -> None:
+        self._cache.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def cache_invalidate(self, *args, **kw) -> bool:
+        """Remove the cached result of given arguments"""
+        return self._cache.pop(self.make_key(args, kw), None) is not None
+
+
+@overload
+def alru_cache(
+    func: Callable[..., Awaitable[T_Retval]],
+    /,
+) -> AsyncLRUCache[T_Retval]: ...
+
+
+@overload
+def alru_cache(
+    func: None = None,
+    /,
+    maxsize: int | None = 128,
+    ttl: int | float | None = None,
+    typed: bool = False,
+) -> Callable[[Callable[..., Awaitable[T_Retval]]], AsyncLRUCache[T_Retval]]: ...
+
+
+def alru_cache(
+    func: Callable[..., Awaitable[T_Retval]] | None = None,
+    /,
+    maxsize: int | None = 128,
+    ttl: int | float | None = None,
+    typed: bool = False,
+) -> (
+    AsyncLRUCache[T_Retval]
+    | Callable[[Callable[..., Awaitable[T_Retval]]], AsyncLRUCache[T_Retval]]
+):
+    """Like functools.lru_cache, but cache the result of coroutine function
+
+    Concurrent calls with the same arguments share one in-flight call,
+    results are evicted by LRU and `ttl`. Exceptions are not cached.
+
+    Usage::
+        >>> from asyncur import alru_cache
+        >>> @alru_cache(maxsize=1024, ttl=60)
+        ... async def get_user(user_id: int) -> dict:
+        ...     return await fetch_user(user_id)
+        ...
+        >>> await gather(*[get_user(1) for _ in range(10)])  # fetch only once
+        >>> get_user.cache_info()
+        CacheInfo(hits=9, misses=1, evictions=0, maxsize=1024, currsize=1)
+
+    :param maxsize: max number of cached results, None to be unlimit.
+    :param ttl: seconds for a result to be expired, None to never expire.
+    :param typed: cache arguments of different types separately, e.g.: 1 and 1.0
+    """
+    if func is not None:
+        return AsyncLRUCache(func, maxsize, ttl, typed)
+
+    def decorator(f: Callable[..., Awaitable[T_Retval]]) -> AsyncLRUCache[T_Retval]:
+        return AsyncLRUCache(f, maxsize, ttl, typed)
+
+    return decorator
@@ -1,22 +1,330 @@
+import functools
+import json
 import os
+import time
+import warnings
 from contextlib import AbstractAsyncContextManager
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Mapping
 
 from redis import asyncio as aioredis
+from redis.asyncio.client import Pipeline
+from redis.asyncio.cluster import ClusterNode, RedisCluster
+from redis.asyncio.sentinel import Sentinel, SentinelConnectionPool
+
+from .exceptions import ParamsError
+from .timing import Histogram
+from .utils import AttrDict
 
 if TYPE_CHECKING:  # pragma: no cover
     from fastapi import FastAPI, Request
 
 
-class RedisClient(aioredis.Redis, AbstractAsyncContextManager):
-    def __init__(self, **kw) -> None:
+def parse_nodes(nodes: str) -> list[tuple[str, int]]:
+    """Parse string like 'host1:26379,host2:26379' to be list of (host, port)
+
+    Usage::
+        >>> parse_nodes('127.0.0.1:26379, localhost:26380')
+        [('127.0.0.1', 26379), ('localhost', 26380)]
+    """
+    pairs = []
+    for node in nodes.split(","):
+        if node := node.strip():
+            host, _, port = node.rpartition(":")
+            pairs.append((host, int(port)))
+    return pairs
+
+
+def _request_app_state(app) -> Any:
+    # isinstance(app, Request) -> app.app.state
+    if (_app := getattr(app, "app", None)) and (state := getattr(_app, "state", None)):
+        return state
+    return None
+
+
+def payload_size(value: Any) -> int:
+    """Approximate number of bytes of command arguments or response"""
+    if isinstance(value, (bytes, str, bytearray, memoryview)):
+        return len(value)
+    if isinstance(value, (list, tuple, set)):
+        return sum(payload_size(i) for i in value)
+    if isinstance(value, dict):
+        return sum(payload_size(k) + payload_size(v) for k, v in value.items())
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return len(str(value))
+    return 0
+
+
+class CommandStats:
+    __slots__ = ("latency", "bytes_out", "bytes_in", "errors")
+
+    def __init__(self) -> None:
+        self.latency = Histogram()
+        self.bytes_out = self.bytes_in = self.errors = 0
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            **self.latency.snapshot(),
+            "bytes_out": self.bytes_out,
+            "bytes_in": self.bytes_in,
+            "errors": self.errors,
+        }
+
+
+class RedisMetrics:
+    """Per-command latency and payload size of redis client
+
+    Usage::
+        >>> redis = AsyncRedis(app, metrics=True)
+        >>> await redis.get('a')
+        >>> redis.metrics.snapshot()['commands']['GET']['count']
+        1
+    """
+
+    PIPELINE_SIZE_BOUNDS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self.commands: dict[str, CommandStats] = {}
+        self.pipelines = CommandStats()
+        self.pipeline_size = Histogram(self.PIPELINE_SIZE_BOUNDS)
+        # Time of `ConnectionPool.get_connection`: waiting for a free connection,
+        # plus connecting and health checking it when needed
+        self.get_connection = Histogram()
+
+    def command(self, name: Any) -> CommandStats:
+        try:
+            return self.commands[name]
+        except KeyError:
+            stats = self.commands[name] = CommandStats()
+            return stats
+
+    @staticmethod
+    def record(
+        stats: CommandStats, cost: float, args: Any, result: Any, error=False
+    ) -> None:
+        stats.latency.record(cost)
+        stats.bytes_out += payload_size(args)
+        if error:
+            stats.errors += 1
+        else:
+            stats.bytes_in += payload_size(result)
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "commands": {str(k): v.snapshot() for k, v in self.commands.items()},
+            "pipelines": self.pipelines.snapshot(),
+            "pipeline_size": self.pipeline_size.snapshot(),
+            "get_connection": self.get_connection.snapshot(),
+        }
+
+    def instrument_pool(self, pool: aioredis.ConnectionPool) -> None:
+        """Record the time cost to get connection from pool,
+        which includes connect time when a new connection is created
+        """
+        get_connection, histogram = pool.get_connection, self.get_connection
+
+        @functools.wraps(get_connection)
+        async def timed_get_connection(*args, **kw):
+            start = time.perf_counter()
+            try:
+                return await get_connection(*args, **kw)
+            finally:
+                histogram.record(time.perf_counter() - start)
+
+        pool.get_connection = timed_get_connection  # type:ignore[method-assign]
+
+
+class InstrumentedPipeline(Pipeline):
+    metrics: RedisMetrics
+
+    async def execute(self, raise_on_error: bool = True) -> list[Any]:
+        stack = [args for args, _ in self.command_stack]
+        start = time.perf_counter()
+        try:
+            result = await super().execute(raise_on_error)
+        except Exception:
+            self.metrics.record(
+                self.metrics.pipelines, time.perf_counter() - start, stack, None, True
+            )
+            raise
+        self.metrics.record(
+            self.metrics.pipelines, time.perf_counter() - start, stack, result
+        )
+        self.metrics.pipeline_size.record(len(stack))
+        return result
+
+
+class JsonMixin:
+    """Read/write JSON values, objects are decoded to be `AttrDict` directly"""
+
+    async def get_json(self, name: Any) -> Any:
+        """Get and decode JSON value, None if key not exists"""
+        value = await self.get(name)  # type:ignore[attr-defined]
+        return None if value is None else AttrDict.loads(value)
+
+    async def mget_json(self, keys: Any, *args: Any) -> list[Any]:
+        return [
+            None if value is None else AttrDict.loads(value)
+            for value in await self.mget(keys, *args)  # type:ignore[attr-defined]
+        ]
+
+    async def set_json(self, name: Any, value: Any, **kw) -> Any:
+        """Encode value to be JSON and set it, `kw` are passed to `set`, e.g.: ex=60"""
+        return await self.set(  # type:ignore[attr-defined]
+            name, json.dumps(value, separators=(",", ":")), **kw
+        )
+
+
+class RedisClient(JsonMixin, aioredis.Redis, AbstractAsyncContextManager):
+    """Redis client, connect to sentinel master if `sentinels` is given
+
+    :param sentinels: list of (host, port), default to parse env `REDIS_SENTINELS`
+    :param service_name: sentinel master name, default to env `REDIS_SENTINEL_SERVICE`
+    :param sentinel_kwargs: extra kwargs for the connections to sentinels
+    :param metrics: set True (or a `RedisMetrics` instance) to record latency
+        and payload size of commands, see `RedisMetrics`
+    """
+
+    metrics: RedisMetrics | None = None
+
+    def __init__(
+        self,
+        *,
+        sentinels: list[tuple[str, int]] | None = None,
+        service_name: str | None = None,
+        sentinel_kwargs: dict[str, Any] | None = None,
+        metrics: RedisMetrics | bool | None = None,
+        **kw,
+    ) -> None:
+        self._init_client(sentinels, service_name, sentinel_kwargs, **kw)
+        if metrics:
+            self.metrics = RedisMetrics() if metrics is True else metrics
+            self.metrics.instrument_pool(self.connection_pool)
+
+    def _init_client(
+        self,
+        sentinels: list[tuple[str, int]] | None,
+        service_name: str | None,
+        sentinel_kwargs: dict[str, Any] | None,
+        **kw,
+    ) -> None:
+        if sentinels is None and (nodes := os.getenv("REDIS_SENTINELS")):
+            sentinels = parse_nodes(nodes)
+        if sentinels:
+            if service_name is None:
+                service_name = os.getenv("REDIS_SENTINEL_SERVICE", "mymaster")
+            self._sentinel: Sentinel | None = Sentinel(
+                sentinels, sentinel_kwargs=sentinel_kwargs
+            )
+            pool: SentinelConnectionPool = SentinelConnectionPool(
+                service_name, self._sentinel, is_master=True, **kw
+            )
+            super().__init__(connection_pool=pool)
+            # The client owns the pool, same as `Sentinel.master_for`
+            self.auto_close_connection_pool = True
+            return
+        self._sentinel = None
         if "host" not in kw and (host := os.getenv("REDIS_HOST")):
             kw["host"] = host
         super().__init__(**kw)
 
+    async def __aexit__(self, *args, **kw):
+        await self.aclose()  # type:ignore[attr-defined]
+        if self._sentinel is not None:
+            for sentinel in self._sentinel.sentinels:
+                await sentinel.aclose()  # type:ignore[attr-defined]
+
+    async def execute_command(self, *args, **options) -> Any:
+        if (metrics := self.metrics) is None:
+            return await super().execute_command(*args, **options)
+        stats = metrics.command(args[0])
+        start = time.perf_counter()
+        try:
+            result = await super().execute_command(*args, **options)
+        except Exception:
+            metrics.record(stats, time.perf_counter() - start, args[1:], None, True)
+            raise
+        metrics.record(stats, time.perf_counter() - start, args[1:], result)
+        return result
+
+    def pipeline(self, transaction: bool = True, shard_hint: str | None = None):
+        if self.metrics is None:
+            return super().pipeline(transaction, shard_hint)
+        pipe = InstrumentedPipeline(
+            self.connection_pool, self.response_callbacks, transaction, shard_hint
+        )
+        pipe.metrics = self.metrics
+        return pipe
+
+
+class RedisClusterClient(JsonMixin, RedisCluster, AbstractAsyncContextManager):
+    """Redis cluster client
+
+    Startup nodes default to parse env `REDIS_CLUSTER_NODES`, or use `REDIS_HOST`.
+    Multi-key commands `mget`/`mset` are split by slot and sent in one pipeline,
+    so they are not atomic when keys belong to more than one slot.
+
+    Client metrics are not supported, `metrics` is ignored with a warning.
+
+    :raises ParamsError: when sentinel options are given, as cluster has no sentinels
+    """
+
+    SENTINEL_OPTIONS = ("sentinels", "service_name", "sentinel_kwargs")
+
+    def __init__(self, **kw) -> None:
+        if given := [k for k in self.SENTINEL_OPTIONS if kw.pop(k, None) is not None]:
+            raise ParamsError(f"Sentinel options can not be used with cluster: {given}")
+        if kw.pop("metrics", None):
+            warnings.warn("Metrics are not supported by cluster client", stacklevel=2)
+        if "host" not in kw and "startup_nodes" not in kw and "url" not in kw:
+            if nodes := os.getenv("REDIS_CLUSTER_NODES"):
+                kw["startup_nodes"] = [ClusterNode(*i) for i in parse_nodes(nodes)]
+            else:
+                kw["host"] = os.getenv("REDIS_HOST", "localhost")
+        super().__init__(**kw)
+
     async def __aexit__(self, *args, **kw):
         await self.aclose()  # type:ignore[attr-defined]
 
+    async def mget(self, keys, *args) -> list[Any]:  # type:ignore[override]
+        return await self.mget_nonatomic(keys, *args)  # type:ignore[attr-defined]
+
+    async def mset(self, mapping: Mapping) -> bool:  # type:ignore[override]
+        return all(await self.mset_nonatomic(mapping))  # type:ignore[attr-defined]
+
+
+def use_cluster(cluster: bool | None, kw: dict) -> bool:
+    if cluster is not None:
+        return cluster
+    return "startup_nodes" in kw or bool(os.getenv("REDIS_CLUSTER_NODES"))
+
+
+class AsyncRedisCluster(RedisClusterClient):
+    """Async redis cluster client for FastAPI, see `AsyncRedis`"""
+
+    def __new__(
+        cls, app: "FastAPI | Request | None" = None, **kw
+    ) -> "AsyncRedisCluster":
+        if (state := _request_app_state(app)) is not None:
+            return state.redis
+        return super().__new__(cls)
+
+    def __init__(self, app=None, **kw) -> None:
+        if _request_app_state(app) is not None:
+            # Instance was fetched from app.state by `__new__`
+            return
+        super().__init__(**kw)
+        if app is not None and hasattr(app, "state"):
+            # isinstance(app, FastAPI)
+            app.state.redis = self
+
+    async def __aenter__(self) -> "AsyncRedisCluster":
+        # Check connection when app startup
+        await self.initialize()
+        return self
+
 
 class AsyncRedis(RedisClient):
     """Async redis client for FastAPI
@@ -39,17 +347,32 @@ class AsyncRedis(RedisClient):
         ...     async with AsyncRedis(host='localhost') as redis:
         ...         keys: list[str] = await redis.keys()
         ...
+
+    Redis Cluster and Sentinel::
+        >>> # AsyncRedisCluster instance will be return when `cluster=True`,
+        >>> # or `startup_nodes`/env `REDIS_CLUSTER_NODES` is given
+        >>> cluster = AsyncRedis(app, cluster=True, host='localhost')
+        >>> # Connect to master by sentinels, or set env `REDIS_SENTINELS`
+        >>> master = AsyncRedis(app, sentinels=[('localhost', 26379)])
     """
 
-    def __new__(cls, app: "FastAPI | Request | None" = None, **kw) -> "AsyncRedis":
-        if (_app := getattr(app, "app", None)) and (
-            state := getattr(_app, "state", None)
-        ):
-            # isinstance(app, Request)
+    def __new__(
+        cls,
+        app: "FastAPI | Request | None" = None,
+        *,
+        cluster: bool | None = None,
+        **kw,
+    ) -> "AsyncRedis":
+        if (state := _request_app_state(app)) is not None:
             return state.redis
-        return super().__new__(cls, **kw)
+        if use_cluster(cluster, kw):
+            return AsyncRedisCluster(app, **kw)  # type:ignore[return-value]
+        return super().__new__(cls)
 
-    def __init__(self, app=None, **kw) -> None:
+    def __init__(self, app=None, *, cluster: bool | None = None, **kw) -> None:
+        if _request_app_state(app) is not None:
+            # Instance was fetched from app.state by `__new__`
+            return
         super().__init__(**kw)
         if app is not None and hasattr(app, "state"):
             # isinstance(app, FastAPI)
@@ -1,2 +1,6 @@
 class ParamsError(Exception):
     pass
+
+
+class HeartbeatTimeout(Exception):
+    pass
@@ -0,0 +1,87 @@
+from typing import TYPE_CHECKING, Sequence
+
+from .exceptions import ParamsError
+from .pipeline import Pipeline
+from .xls import FileLike, iter_xls
+
+if TYPE_CHECKING:  # pragma: no cover
+    from redis.asyncio import Redis, RedisCluster
+
+# Field name of the row number in key templates, not to be shadowed by columns
+ROW_INDEX = "_index"
+
+
+async def xls_to_redis(
+    redis: "Redis | RedisCluster",
+    file: FileLike,
+    key: str = "row:{_index}",
+    indexes: Sequence[str] = (),
+    *,
+    chunk_size: int = 1000,
+    max_in_flight: int = 4,
+    sheet_name: str | int = 0,
+) -> int:
+    """Write each row of excel to be a redis hash, and add its key to index sets
+
+    Rows are read chunk by chunk, each chunk is sent by one pipeline
+    without MULTI/EXEC, at most `max_in_flight` chunks are waiting for redis,
+    so that memory is bounded no matter how large the file is.
+
+    Usage::
+        >>> from asyncur import AsyncRedis
+        >>> async with AsyncRedis() as redis:
+        ...     total = await xls_to_redis(
+        ...         redis, 'users.xlsx', 'user:{id}', indexes=['users:city:{city}']
+        ...     )
+
+    :param redis: redis client, e.g.: `AsyncRedis(app)`
+    :param file: excel file or content
+    :param key: template of the hash key, formatted by the row values (header as
+        field name) and `_index` (0 for the first row below the header)
+    :param indexes: templates of set keys, formatted the same as `key`,
+        the hash key of the row is added to each of them
+    :param chunk_size: number of rows sent by one pipeline
+    :param max_in_flight: max number of pipelines sending at the same time
+    :param sheet_name: name or index of the sheet
+    :return: number of imported rows
+    :raises ParamsError: when the sheet has a column named `_index`
+    """
+    index = 0
+
+    def to_commands(rows: list[dict]) -> list[tuple[str, dict, list[str]]]:
+        nonlocal index
+        commands = []
+        for row in rows:
+            mapping = {str(k): v for k, v in row.items()}
+            if ROW_INDEX in mapping:
+                raise ParamsError(
+                    f"Column name {ROW_INDEX!r} is reserved for row index"
+                )
+            fields = dict(mapping, **{ROW_INDEX: index})
+            name = key.format_map(fields)
+            commands.append((name, mapping, [i.format_map(fields) for i in indexes]))
+            index += 1
+        return commands
+
+    async def write(commands: list[tuple[str, dict, list[str]]]) -> int:
+        pipe = redis.pipeline(transaction=False)
+        for name, mapping, sets in commands:
+            pipe.hset(name, mapping=mapping)  # type:ignore[union-attr]
+            for s in sets:
+                pipe.sadd(s, name)  # type:ignore[union-attr]
+        await pipe.execute()
+        return len(commands)
+
+    total = 0
+
+    def count(written: int) -> None:
+        nonlocal total
+        total += written
+
+    await (
+        Pipeline(iter_xls(file, chunk_size, as_str=True, sheet_name=sheet_name), 1)
+        .map(to_commands)
+        .map(write, concurrency=max_in_flight)
+        .run(count)
+    )
+    return total
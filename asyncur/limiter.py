@@ -0,0 +1,111 @@
+from contextlib import AbstractAsyncContextManager
+from typing import TYPE_CHECKING
+
+import anyio
+
+from .exceptions import ParamsError
+
+if TYPE_CHECKING:  # pragma: no cover
+    from redis.asyncio import Redis, RedisCluster
+
+# KEYS[1]: bucket key
+# ARGV: capacity, refill rate (tokens per second), requested tokens
+# Return: {granted tokens, seconds to wait for next token}
+TOKEN_BUCKET_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local requested = tonumber(ARGV[3])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local data = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(data[1]) or capacity
+local ts = tonumber(data[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local granted = math.min(requested, math.floor(tokens))
+tokens = tokens - granted
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil(capacity / rate * 1000) + 1000)
+local wait = 0
+if granted == 0 then
+    wait = (1 - tokens) / rate
+end
+return {granted, tostring(wait)}
+"""
+
+
+class RedisRateLimiter(AbstractAsyncContextManager):
+    """Token bucket rate limiter that shared by processes and hosts through redis
+
+    Usage::
+        >>> from asyncur import AsyncRedis
+        >>> from asyncur.aio import bulk_gather
+        >>> async def fetch_all(urls):
+        ...     # All workers that use the same key share 100 requests per second
+        ...     limiter = RedisRateLimiter(AsyncRedis(), 'quota:api', rate=100)
+        ...     return await bulk_gather([fetch(i) for i in urls], limiter=limiter)
+        ...
+        >>> async def do_sth():
+        ...     async with limiter:
+        ...         await fetch(url)
+
+    :param redis: redis client, e.g.: `AsyncRedis(request)`
+    :param key: redis key of the bucket, limiters with the same key share the rate
+    :param rate: number of tokens refilled in each period
+    :param period: seconds of a period
+    :param capacity: max tokens in the bucket (burst size), default to `rate`
+    :param prefetch: number of tokens to take from redis in one round trip,
+        the extra ones are cached locally for the next acquires.
+    """
+
+    def __init__(
+        self,
+        redis: "Redis | RedisCluster",
+        key: str,
+        rate: int | float,
+        period: int | float = 1,
+        capacity: int | None = None,
+        prefetch: int = 1,
+    ) -> None:
+        if rate <= 0 or period <= 0:
+            raise ParamsError(f"Invalid value with {rate=} & {period=}")
+        if capacity is None:
+            capacity = max(int(rate), 1)
+        if not 0 < prefetch <= capacity:
+            raise ParamsError(f"Invalid value with {prefetch=} & {capacity=}")
+        self.key = key
+        self.rate = rate / period
+        self.capacity = capacity
+        self.prefetch = prefetch
+        self._tokens = 0
+        self._lock = anyio.Lock()
+        self._script = redis.register_script(  # type:ignore[union-attr]
+            TOKEN_BUCKET_SCRIPT
+        )
+
+    async def take(self, count: int) -> tuple[int, float]:
+        """Take at most `count` tokens from redis
+
+        :return: number of granted tokens, and seconds to wait if none granted
+        """
+        granted, wait = await self._script(
+            keys=[self.key], args=[self.capacity, self.rate, count]
+        )
+        return int(granted), float(wait)
+
+    async def acquire(self) -> None:
+        """Wait until a token is available"""
+        async with self._lock:
+            while not self._tokens:
+                granted, wait = await self.take(self.prefetch)
+                if granted:
+                    self._tokens += granted
+                else:
+                    await anyio.sleep(wait)
+            self._tokens -= 1
+
+    async def __aenter__(self) -> "RedisRateLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *args, **kw) -> None:
+        return None
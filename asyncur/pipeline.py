@@ -0,0 +1,204 @@
+import inspect
+import sys
+from typing import TYPE_CHECKING, Any, AsyncIterable, Awaitable, Callable, Iterable
+
+import anyio
+
+from .exceptions import ParamsError
+
+if TYPE_CHECKING:  # pragma: no cover
+    from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
+
+if sys.version_info < (3, 11):
+    from exceptiongroup import ExceptionGroup  # pragma: no cover
+
+# A worker receives items from upstream and sends results to downstream,
+# `send` is None for the sink stage
+Worker = Callable[
+    ["MemoryObjectReceiveStream", "MemoryObjectSendStream | None"], Awaitable[None]
+]
+
+
+class Pipeline:
+    """Chain stages by bounded memory object streams, so that the stages run
+    at the same time, and a slow stage blocks its upstream (backpressure)
+    instead of buffering everything in memory.
+
+    Usage::
+        >>> from asyncur.xls import load_xls
+        >>> async def main():
+        ...     rows = await load_xls('users.xlsx')
+        ...     written = await (
+        ...         Pipeline(rows, buffer=1000)
+        ...         .map(transform, concurrency=4)
+        ...         .batch(500, max_wait=1)
+        ...         .map(write_to_redis, concurrency=8)
+        ...         .flatten()
+        ...         .run()
+        ...     )
+
+    :param source: items to be processed, can be iterable or async iterable
+    :param buffer: max items waiting in the stream between two stages
+    """
+
+    def __init__(self, source: Iterable | AsyncIterable, buffer: int = 100) -> None:
+        if buffer < 0:
+            raise ParamsError(f"Invalid value with {buffer=}")
+        self.source = source
+        self.buffer = buffer
+        self._stages: list[tuple[Worker, int]] = []
+
+    def pipe(self, worker: Worker, concurrency: int = 1) -> "Pipeline":
+        """Add custom stage that run by `concurrency` tasks"""
+        if concurrency <= 0:
+            raise ParamsError(f"Invalid value with {concurrency=}")
+        self._stages.append((worker, concurrency))
+        return self
+
+    def map(self, func: Callable[[Any], Any], concurrency: int = 1) -> "Pipeline":
+        """Send result of `func(item)` for each item, func can be sync or async.
+        Results are not in the order of items when concurrency > 1.
+        """
+
+        async def worker(receive, send) -> None:
+            async for item in receive:
+                result = func(item)
+                if inspect.isawaitable(result):
+                    result = await result
+                await send.send(result)
+
+        return self.pipe(worker, concurrency)
+
+    def batch(self, size: int, max_wait: int | float | None = None) -> "Pipeline":
+        """Group items to be lists with at most `size` items
+
+        :param max_wait: seconds to wait for a batch to be full,
+            send it anyway after that. None to always wait.
+        """
+        if size <= 0 or (max_wait is not None and max_wait <= 0):
+            raise ParamsError(f"Invalid value with {size=} & {max_wait=}")
+
+        async def worker(receive, send) -> None:
+            items: list = []
+            first_at = 0.0
+            lock = anyio.Lock()
+
+            async def flush() -> None:
+                nonlocal items
+                if items:
+                    batch, items = items, []
+                    await send.send(batch)
+
+            async def flush_expired(wait: int | float) -> None:
+                while True:
+                    delay = first_at + wait - anyio.current_time() if items else wait
+                    if delay > 0:
+                        await anyio.sleep(delay)
+                        continue
+                    async with lock:
+                        if items and anyio.current_time() - first_at >= wait:
+                            await flush()
+
+            async with anyio.create_task_group() as tg:
+                if max_wait is not None:
+                    tg.start_soon(flush_expired, max_wait)
+                async for item in receive:
+                    async with lock:
+                        if not items:
+                            first_at = anyio.current_time()
+                        items.append(item)
+                        if len(items) >= size:
+                            await flush()
+                tg.cancel_scope.cancel()
+            await flush()
+
+        return self.pipe(worker)
+
+    def flatten(self) -> "Pipeline":
+        """Send each element of the received iterables, e.g.: reverse of `batch`"""
+
+        async def worker(receive, send) -> None:
+            async for items in receive:
+                for item in items:
+                    await send.send(item)
+
+        return self.pipe(worker)
+
+    async def _produce(self, send: "MemoryObjectSendStream") -> None:
+        async with send:
+            if isinstance(self.source, AsyncIterable):
+                async for item in self.source:
+                    await send.send(item)
+            else:
+                for item in self.source:
+                    await send.send(item)
+
+    @staticmethod
+    async def _work(
+        worker: Worker,
+        receive: "MemoryObjectReceiveStream",
+        send: "MemoryObjectSendStream | None",
+    ) -> None:
+        async with receive:
+            if send is None:
+                await worker(receive, None)
+            else:
+                async with send:
+                    await worker(receive, send)
+
+    async def run(
+        self, sink: Callable[[Any], Any] | None = None, concurrency: int = 1
+    ) -> int:
+        """Start all stages and wait for them to finish
+
+        :param sink: function (sync or async) to receive output items of last stage
+        :param concurrency: number of tasks to call the sink
+        :return: number of output items
+        """
+        count = 0
+
+        async def drain(receive, _send) -> None:
+            nonlocal count
+            async for item in receive:
+                if sink is not None:
+                    result = sink(item)
+                    if inspect.isawaitable(result):
+                        await result
+                count += 1
+
+        stages = [*self._stages, (drain, concurrency)]
+        send: MemoryObjectSendStream
+        receive: MemoryObjectReceiveStream
+        try:
+            async with anyio.create_task_group() as tg:
+                send, receive = anyio.create_memory_object_stream(self.buffer)
+                tg.start_soon(self._produce, send)
+                for index, (worker, n) in enumerate(stages):
+                    next_send: MemoryObjectSendStream | None = None
+                    next_receive: MemoryObjectReceiveStream | None = None
+                    if index < len(stages) - 1:
+                        next_send, next_receive = anyio.create_memory_object_stream(
+                            self.buffer
+                        )
+                    # Each task owns a clone, downstream ends when all of them close
+                    for _ in range(n):
+                        tg.start_soon(
+                            self._work,
+                            worker,
+                            receive.clone(),
+                            next_send and next_send.clone(),
+                        )
+                    receive.close()
+                    if next_send is not None:
+                        next_send.close()
+                    if next_receive is not None:
+                        receive = next_receive
+        except ExceptionGroup as e:
+            raise e.exceptions[0]
+        return count
+
+    async def collect(self) -> list:
+        """Run and return output items of the last stage as a list"""
+        items: list = []
+        await self.run(items.append)
+        return items
@@ -0,0 +1,233 @@
+from typing import TYPE_CHECKING, Any, Awaitable, Callable
+
+import anyio
+from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
+from redis.exceptions import ResponseError
+
+from .exceptions import ParamsError
+
+if TYPE_CHECKING:  # pragma: no cover
+    from redis.asyncio import Redis
+
+Handler = Callable[[Any, dict], Awaitable[Any]]
+
+
+class StreamConsumer:
+    """Redis Streams consumer group worker
+
+    Entries are read by batched `XREADGROUP`, processed by `concurrency` tasks,
+    and acknowledged by batched `XACK`. Entries that are pending for more than
+    `claim_idle` seconds (e.g.: consumer crashed) are reclaimed by `XAUTOCLAIM`.
+    An entry is not acknowledged if its handler raises, so it will be retried
+    after reclaimed. Without `max_deliveries`, an entry that always fails is
+    retried forever; with it, a reclaimed entry that has been delivered more
+    than `max_deliveries` times is acknowledged without calling the handler,
+    and copied to the `dead_letter` stream if given.
+
+    Usage::
+        >>> from contextlib import asynccontextmanager
+        >>> from asyncur import AsyncRedis, start_tasks
+        >>> async def handle(entry_id, fields: dict) -> None:
+        ...     print(entry_id, fields)
+        ...
+        >>> @asynccontextmanager
+        ... async def lifespan(app):
+        ...     async with AsyncRedis(app) as redis:
+        ...         consumer = StreamConsumer(redis, 'jobs', 'group', 'c1', handle)
+        ...         async with start_tasks(consumer.run):
+        ...             yield
+        ...             # Finish the received entries and flush acks before cancel
+        ...             await consumer.stop()
+
+    :param redis: redis client, e.g.: `AsyncRedis(app)`
+    :param stream: stream key
+    :param group: consumer group name, will be created if not exists
+    :param consumer: consumer name, should be unique for each worker
+    :param handler: async function that receive (entry_id, fields)
+    :param batch_size: max number of entries read by one command,
+        it is also the size of the local buffer.
+    :param concurrency: number of tasks to process entries
+    :param block: seconds to block for `XREADGROUP` when there is no new entry
+    :param ack_size: send `XACK` when the number of processed entries reach it
+    :param ack_interval: send `XACK` at least every `ack_interval` seconds
+    :param claim_idle: seconds for a pending entry to be reclaimed, set 0 to disable
+    :param max_deliveries: max times to deliver an entry to handlers, None to be unlimit
+    :param dead_letter: stream key to add the entries that reach `max_deliveries`
+    """
+
+    def __init__(
+        self,
+        redis: "Redis",
+        stream: str,
+        group: str,
+        consumer: str,
+        handler: Handler,
+        *,
+        batch_size: int = 100,
+        concurrency: int = 10,
+        block: int | float = 1,
+        ack_size: int = 100,
+        ack_interval: int | float = 1,
+        claim_idle: int | float = 60,
+        max_deliveries: int | None = None,
+        dead_letter: str | None = None,
+    ) -> None:
+        if batch_size <= 0 or concurrency <= 0 or ack_size <= 0:
+            raise ParamsError(
+                f"Invalid value with {batch_size=}, {concurrency=}, {ack_size=}"
+            )
+        if block <= 0:
+            # `BLOCK 0` waits forever, then `stop` could never finish
+            raise ParamsError(f"Invalid value with {block=}")
+        if max_deliveries is not None and max_deliveries <= 0:
+            raise ParamsError(f"Invalid value with {max_deliveries=}")
+        self.redis = redis
+        self.stream = stream
+        self.group = group
+        self.consumer = consumer
+        self.handler = handler
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.block = block
+        self.ack_size = ack_size
+        self.ack_interval = ack_interval
+        self.claim_idle = claim_idle
+        self.max_deliveries = max_deliveries
+        self.dead_letter = dead_letter
+        self.processed = self.failed = self.dead = 0
+        self._acks: list = []
+        self._claim_start: Any = "0-0"
+        self._stopping: anyio.Event | None = None
+        self._stopped: anyio.Event | None = None
+
+    async def create_group(self) -> None:
+        """Create consumer group (and the stream) if not exists"""
+        try:
+            await self.redis.xgroup_create(self.stream, self.group, "0", mkstream=True)
+        except ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    async def read(self) -> list[tuple[Any, dict]]:
+        """Read new entries by `XREADGROUP`"""
+        resp = await self.redis.xreadgroup(
+            self.group,
+            self.consumer,
+            {self.stream: ">"},
+            count=self.batch_size,
+            block=max(int(self.block * 1000), 1),
+        )
+        if not resp:
+            return []
+        if isinstance(resp, dict):  # RESP3
+            return [i for entries in resp.values() for i in entries[0]]
+        return [i for _, entries in resp for i in entries]
+
+    async def claim(self) -> list[tuple[Any, dict]]:
+        """Reclaim entries that pending for more than `claim_idle` seconds"""
+        resp = await self.redis.xautoclaim(
+            self.stream,
+            self.group,
+            self.consumer,
+            int(self.claim_idle * 1000),
+            start_id=self._claim_start,
+            count=self.batch_size,
+        )
+        self._claim_start, entries = resp[0], resp[1]
+        # Entries that deleted from stream are returned as (id, None) by redis<7
+        entries = [i for i in entries if i[1] is not None]
+        if self.max_deliveries is None or not entries:
+            return entries
+        counts = await self.deliveries([i[0] for i in entries])
+        dead = [i for i in entries if counts.get(i[0], 0) > self.max_deliveries]
+        if dead:
+            await self.discard(dead)
+            entries = [i for i in entries if i not in dead]
+        return entries
+
+    async def deliveries(self, ids: list) -> dict[Any, int]:
+        """Number of times that each pending entry has been delivered"""
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for i in ids:
+                pipe.xpending_range(self.stream, self.group, min=i, max=i, count=1)
+            resp = await pipe.execute()
+        return {p["message_id"]: p["times_delivered"] for r in resp for p in r}
+
+    async def discard(self, entries: list[tuple[Any, dict]]) -> None:
+        """Acknowledge entries without processing, add them to `dead_letter`"""
+        if self.dead_letter:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for _, fields in entries:
+                    pipe.xadd(self.dead_letter, fields)
+                await pipe.execute()
+        await self.redis.xack(self.stream, self.group, *(i[0] for i in entries))
+        self.dead += len(entries)
+
+    async def ack(self) -> None:
+        """Flush processed entry ids by one `XACK`"""
+        if ids := self._acks:
+            self._acks = []
+            await self.redis.xack(self.stream, self.group, *ids)
+
+    async def _process(self, receive: MemoryObjectReceiveStream) -> None:
+        async with receive:
+            async for entry_id, fields in receive:
+                try:
+                    await self.handler(entry_id, fields)
+                except Exception:
+                    self.failed += 1
+                    continue
+                self.processed += 1
+                self._acks.append(entry_id)
+                if len(self._acks) >= self.ack_size:
+                    await self.ack()
+
+    async def _ack_periodically(self) -> None:
+        while True:
+            await anyio.sleep(self.ack_interval)
+            await self.ack()
+
+    async def _fetch(self, send: MemoryObjectSendStream) -> None:
+        assert self._stopping is not None
+        claim_at = anyio.current_time() + self.claim_idle
+        async with send:
+            while not self._stopping.is_set():
+                entries: list = []
+                if self.claim_idle and anyio.current_time() >= claim_at:
+                    entries = await self.claim()
+                    if self._claim_start in ("0-0", b"0-0"):
+                        # Scan finished, wait next round
+                        claim_at = anyio.current_time() + self.claim_idle
+                if not entries:
+                    entries = await self.read()
+                for entry in entries:
+                    # Block here when handlers are slow, to keep memory bounded
+                    await send.send(entry)
+
+    async def run(self) -> None:
+        """Consume entries until `stop` is called or cancelled"""
+        self._stopping, self._stopped = anyio.Event(), anyio.Event()
+        await self.create_group()
+        send: MemoryObjectSendStream
+        receive: MemoryObjectReceiveStream
+        send, receive = anyio.create_memory_object_stream(self.batch_size)
+        try:
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(self._ack_periodically)
+                async with anyio.create_task_group() as workers:
+                    async with receive:
+                        for _ in range(self.concurrency):
+                            workers.start_soon(self._process, receive.clone())
+                    workers.start_soon(self._fetch, send)
+                tg.cancel_scope.cancel()
+        finally:
+            with anyio.CancelScope(shield=True):
+                await self.ack()
+            self._stopped.set()
+
+    async def stop(self) -> None:
+        """Stop reading new entries, wait received ones to be processed and acked"""
+        if self._stopping is None or self._stopped is None:
+            return
+        self._stopping.set()
+        await self._stopped.wait()
@@ -0,0 +1,212 @@
+import time
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, NamedTuple
+
+import anyio
+
+from .exceptions import HeartbeatTimeout, ParamsError
+
+
+class RestartPolicy(NamedTuple):
+    """How to restart a supervised task
+
+    :param max_restarts: give up after restarted so many times in a row,
+        None to be unlimit.
+    :param backoff: seconds to wait before the first restart, doubled each time.
+    :param max_backoff: max seconds to wait before restart.
+    :param heartbeat_timeout: restart the task if it does not call `heartbeat()`
+        in so many seconds, None to disable.
+    :param reset_after: a run that stayed up so many seconds is healthy, the count
+        of restarts and the backoff start over after it. Default to `max_backoff`.
+    """
+
+    max_restarts: int | None = 3
+    backoff: int | float = 1
+    max_backoff: int | float = 60
+    heartbeat_timeout: int | float | None = None
+    reset_after: int | float | None = None
+
+
+class TaskState:
+    """Health state of a supervised task"""
+
+    def __init__(self, name: str, policy: RestartPolicy) -> None:
+        self.name = name
+        self.policy = policy
+        # pending -> running -> restarting/finished/failed
+        self.status = "pending"
+        # Restarts in a row that count to `max_restarts`, and of all time
+        self.restarts = self.total_restarts = 0
+        self.last_error: BaseException | None = None
+        self.started_at = self.last_heartbeat = 0.0
+
+    def beat(self) -> None:
+        self.last_heartbeat = time.monotonic()
+
+    @property
+    def alive(self) -> bool:
+        if self.status == "finished":
+            return True
+        if self.status != "running":
+            return False
+        if (timeout := self.policy.heartbeat_timeout) is None:
+            return True
+        return time.monotonic() - self.last_heartbeat <= timeout
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "status": self.status,
+            "alive": self.alive,
+            "restarts": self.restarts,
+            "total_restarts": self.total_restarts,
+            "last_error": self.last_error and repr(self.last_error),
+            "started_at": self.started_at,
+            "last_heartbeat": self.last_heartbeat,
+        }
+
+
+_current_state: ContextVar[TaskState | None] = ContextVar(
+    "asyncur_task_state", default=None
+)
+
+
+def heartbeat() -> None:
+    """Report that current supervised task is still making progress"""
+    if (state := _current_state.get()) is not None:
+        state.beat()
+
+
+class SupervisedTask:
+    """Async function that restarts the wrapped one by `state.policy`"""
+
+    def __init__(self, func: Callable[[], Awaitable], state: TaskState) -> None:
+        self.func = func
+        self.state = state
+
+    async def _watch(self, timeout: int | float, scope: anyio.CancelScope) -> None:
+        state = self.state
+        while True:
+            await anyio.sleep(
+                max(timeout - (time.monotonic() - state.last_heartbeat), 0)
+            )
+            if time.monotonic() - state.last_heartbeat > timeout:
+                state.last_error = HeartbeatTimeout(
+                    f"No heartbeat of {state.name!r} in {timeout} seconds"
+                )
+                scope.cancel()
+                return
+
+    async def _run_once(self) -> None:
+        state = self.state
+        state.status = "running"
+        state.started_at = time.monotonic()
+        state.beat()
+        hung, error = False, None
+        async with anyio.create_task_group() as tg:
+            if (timeout := state.policy.heartbeat_timeout) is not None:
+                tg.start_soon(self._watch, timeout, tg.cancel_scope)
+            token = _current_state.set(state)
+            try:
+                await self.func()
+            except Exception as e:
+                # Raise it outside of the task group, to not be an ExceptionGroup
+                error = e
+            finally:
+                _current_state.reset(token)
+                hung = tg.cancel_scope.cancel_called
+            tg.cancel_scope.cancel()
+        if error is not None:
+            raise error
+        if hung and isinstance(state.last_error, HeartbeatTimeout):
+            raise state.last_error
+
+    async def __call__(self) -> None:
+        state, policy = self.state, self.state.policy
+        reset_after = (
+            policy.max_backoff if policy.reset_after is None else policy.reset_after
+        )
+        while True:
+            try:
+                await self._run_once()
+            except Exception as e:
+                state.last_error = e
+            else:
+                state.status = "finished"
+                return
+            if time.monotonic() - state.started_at >= reset_after:
+                # Transient error after a long healthy run, not a crash loop
+                state.restarts = 0
+            if (
+                policy.max_restarts is not None
+                and state.restarts >= policy.max_restarts
+            ):
+                # Give up, but do not take the other tasks down with it
+                state.status = "failed"
+                return
+            state.status = "restarting"
+            # Cap the exponent, float backoff overflows after ~1024 restarts
+            delay = policy.backoff * 2 ** min(state.restarts, 32)
+            state.restarts += 1
+            state.total_restarts += 1
+            await anyio.sleep(min(delay, policy.max_backoff))
+
+
+class Supervisor:
+    """Restart crashed or hung background tasks, and expose their health state
+
+    Usage::
+        >>> from asyncur import start_tasks
+        >>> from asyncur.supervisor import Supervisor, heartbeat
+        >>> async def consume():
+        ...     while True:
+        ...         await handle_next_message()
+        ...         heartbeat()
+        ...
+        >>> supervisor = Supervisor(max_restarts=None)
+        >>> @asynccontextmanager
+        ... async def lifespan(app):
+        ...     app.state.supervisor = supervisor
+        ...     async with start_tasks(
+        ...         warm_cache,
+        ...         supervisor.task(consume, heartbeat_timeout=30),
+        ...         supervisor=supervisor,
+        ...     ):
+        ...         yield
+        ...
+        >>> @app.get('/health')
+        ... async def health() -> dict:
+        ...     return {'ok': supervisor.healthy, 'tasks': supervisor.snapshot()}
+
+    Keyword arguments are the default `RestartPolicy` of the tasks.
+    """
+
+    def __init__(self, **policy) -> None:
+        self.policy = RestartPolicy(**policy)
+        self.states: dict[str, TaskState] = {}
+
+    def task(
+        self, func: Callable[[], Awaitable], name: str | None = None, **policy
+    ) -> SupervisedTask:
+        """Wrap async function to be restarted by policy when it crashed or hung
+
+        :param func: async function without arguments, use functools.partial to bind.
+        :param name: name of the state, default to func.__name__
+        :param policy: override fields of the default `RestartPolicy`
+        """
+        if isinstance(func, SupervisedTask):
+            return func
+        if not callable(func):
+            raise ParamsError(f"Coroutine can not be restarted, use function: {func}")
+        if name is None:
+            name = getattr(func, "__name__", repr(func))
+        if name in self.states:
+            raise ParamsError(f"Duplicated task name: {name!r}")
+        state = self.states[name] = TaskState(name, self.policy._replace(**policy))
+        return SupervisedTask(func, state)
+
+    @property
+    def healthy(self) -> bool:
+        return all(state.alive for state in self.states.values())
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        return {name: state.snapshot() for name, state in self.states.items()}
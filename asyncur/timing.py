@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import bisect
 import functools
 import inspect
 import sys
@@ -107,6 +108,76 @@ class Timer(AbstractContextManager, AbstractAsyncContextManager):
                 return func(*args, **kwargs)
 
 
+class Histogram:
+    """Record values (e.g.: time cost in seconds) into buckets, without printing.
+
+    Usage::
+        >>> h = Histogram()
+        >>> start = time.perf_counter()
+        >>> # ... do sth ...
+        >>> h.record(time.perf_counter() - start)
+        >>> h.snapshot()['count']
+        1
+    """
+
+    # Upper bounds of buckets, values greater than the last one go to `+Inf`
+    BOUNDS: tuple[float, ...] = (
+        0.0005,
+        0.001,
+        0.0025,
+        0.005,
+        0.01,
+        0.025,
+        0.05,
+        0.1,
+        0.25,
+        0.5,
+        1,
+        2.5,
+        5,
+        10,
+    )
+    __slots__ = ("bounds", "buckets", "count", "total", "max")
+
+    def __init__(self, bounds: tuple[float, ...] | None = None) -> None:
+        self.bounds = self.BOUNDS if bounds is None else bounds
+        self.reset()
+
+    def reset(self) -> None:
+        self.buckets = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = self.max = 0.0
+
+    def record(self, value: float) -> None:
+        self.buckets[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def quantile(self, q: float) -> float:
+        """Estimate quantile by the upper bound of the bucket that it falls in"""
+        if not self.count:
+            return 0.0
+        rank, seen = q * self.count, 0
+        for bound, n in zip(self.bounds, self.buckets):
+            seen += n
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "total": self.total,
+            "avg": self.count and self.total / self.count,
+            "max": self.max,
+            "p50": self.quantile(0.5),
+            "p99": self.quantile(0.99),
+            "buckets": dict(zip([*self.bounds, float("inf")], self.buckets)),
+        }
+
+
 @overload
 def timeit(func: str) -> Timer: ...  # pragma: no cover
 
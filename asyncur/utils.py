@@ -1,5 +1,9 @@
+import json
+from typing import TYPE_CHECKING, Any
+
+
 class AttrDict(dict):
-    """Support get dict value by attribution
+    """Support get dict value by attribution, nested dicts are wrapped lazily
 
     Usage::
         >>> d = AttrDict({'a': 1, 'b': {'c': 2, 'd': {'e': 3}}})
@@ -22,21 +26,48 @@ class AttrDict(dict):
         True
     """
 
-    def __init__(self, *args, **kw) -> None:
-        super().__init__(*args, **kw)
-        exclude = set(dir(self)) | set(self.__dict__)
-        for k, v in self.items():
-            if not isinstance(k, str) or k in exclude:
-                continue
-            if isinstance(v, dict):
-                v = self.__class__(v)
-            self.__dict__.setdefault(k, v)
+    if TYPE_CHECKING:  # pragma: no cover
+
+        def __init__(self, *args, **kw) -> None: ...
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called when normal lookup failed, so dict methods win over keys
+        try:
+            value = self[name]
+        except KeyError:
+            raise AttributeError(
+                f"{self.__class__.__name__!r} object has no attribute {name!r}"
+            ) from None
+        if isinstance(value, dict) and not isinstance(value, AttrDict):
+            # Wrap nested dict on first access, and store it back to be the one
+            # shared object, so that `d.a` and `d['a']` are always consistent.
+            value = self.__class__(value)
+            dict.__setitem__(self, name, value)
+        return value
+
+    def _plain(self) -> dict:
+        # Nested dicts that wrapped by access are shown as they were
+        return {
+            k: v._plain() if isinstance(v, AttrDict) else v for k, v in self.items()
+        }
+
+    @classmethod
+    def loads(cls, data: str | bytes | bytearray) -> Any:
+        """Decode JSON with every object built as AttrDict while parsing
+
+        Usage::
+            >>> d = AttrDict.loads('{"a": {"b": [{"c": 1}]}}')
+            >>> d.a.b[0].c
+            1
+        """
+        # Pairs are passed to the class directly, no intermediate dict or re-walk
+        return json.loads(data, object_pairs_hook=cls)
 
     def __str__(self) -> str:
-        return super().__repr__()
+        return repr(self._plain())
 
     def __repr__(self) -> str:
-        return self.__class__.__name__ + "(" + super().__repr__() + ")"
+        return self.__class__.__name__ + "(" + str(self) + ")"
 
 
 def _test() -> None:  # pragma: no cover
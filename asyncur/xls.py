@@ -1,8 +1,13 @@
 from io import BytesIO
+from itertools import islice
 from pathlib import Path
+from typing import Any, AsyncGenerator, Sequence
 
 import anyio
 import pandas as pd
+from anyio import to_thread
+
+from .exceptions import ParamsError
 
 FileLike = str | Path | anyio.Path | bytes
 
@@ -29,3 +34,146 @@ def df_to_datas(df: pd.DataFrame) -> list[dict]:
 async def load_xls(file: FileLike, as_str=False, **kw) -> list[dict]:
     """Read excel file or content to be list of dict"""
     return df_to_datas(await read_excel(file, as_str, **kw))
+
+
+def _cell_value(value: Any, as_str: bool) -> Any:
+    if value is None:
+        return ""
+    return str(value) if as_str else value
+
+
+def _columns(header: tuple) -> list:
+    # Same as pandas, e.g.: 'Unnamed: 1' for the column without header
+    return [f"Unnamed: {i}" if c is None else c for i, c in enumerate(header)]
+
+
+async def _open_workbook(file: FileLike) -> Any:
+    """Open workbook in read-only mode, cells are parsed only when iterated"""
+    from openpyxl import load_workbook
+
+    if isinstance(file, str | Path | anyio.Path):
+        file = await anyio.Path(file).read_bytes()
+    content = file
+    return await to_thread.run_sync(
+        lambda: load_workbook(BytesIO(content), read_only=True, data_only=True)
+    )
+
+
+def _get_sheet(wb: Any, sheet_name: str | int) -> Any:
+    return wb[sheet_name] if isinstance(sheet_name, str) else wb.worksheets[sheet_name]
+
+
+def _first_row(ws: Any) -> tuple:
+    return next(ws.iter_rows(max_row=1, values_only=True), ())
+
+
+async def sheet_names(file: FileLike) -> list[str]:
+    """Names of the sheets, without parsing any cell"""
+    wb = await _open_workbook(file)
+    try:
+        return list(wb.sheetnames)
+    finally:
+        wb.close()
+
+
+async def read_headers(file: FileLike, sheet_name: str | int = 0) -> list:
+    """Column names of the sheet, only the first row is parsed"""
+    wb = await _open_workbook(file)
+    try:
+        ws = _get_sheet(wb, sheet_name)
+        return _columns(await to_thread.run_sync(_first_row, ws))
+    finally:
+        wb.close()
+
+
+async def count_rows(file: FileLike, sheet_name: str | int = 0) -> int:
+    """Number of rows below the header, same as `len(await load_xls(file))`.
+
+    Read from the dimension metadata of the sheet (e.g.: 'A1:D3'), rows are
+    only scanned when the file has no dimension. Trailing empty rows that
+    are formatted may be counted, as they are included in the dimension.
+    """
+    wb = await _open_workbook(file)
+    try:
+        ws = _get_sheet(wb, sheet_name)
+        if ws.max_row is None:  # No dimension, e.g.: written by some libraries
+            total = await to_thread.run_sync(
+                lambda: sum(1 for _ in ws.iter_rows(max_col=1, values_only=True))
+            )
+        else:
+            total = ws.max_row - ws.min_row + 1
+        return max(total - 1, 0)
+    finally:
+        wb.close()
+
+
+async def load_columns(
+    file: FileLike, columns: Sequence, as_str=False, sheet_name: str | int = 0
+) -> list[dict]:
+    """Similar like `load_xls`, but only load the given columns
+
+    Cells out of the range of given columns are not parsed,
+    and the others between them are not converted.
+
+    Usage::
+        >>> await load_columns('users.xlsx', ['id', 'name'])
+        [{'id': 1, 'name': 'Tom'}, ...]
+
+    :param columns: column names in the header row
+    :raises ParamsError: when any column does not exist
+    """
+    wb = await _open_workbook(file)
+    try:
+        ws = _get_sheet(wb, sheet_name)
+        cols = _columns(await to_thread.run_sync(_first_row, ws))
+        if missing := [c for c in columns if c not in cols]:
+            raise ParamsError(f"Columns not found: {missing}")
+        indexes = [cols.index(c) for c in columns]
+        start = min(indexes, default=0)
+        offsets = [i - start for i in indexes]
+
+        def load() -> list[dict]:
+            rows = ws.iter_rows(
+                min_row=2,
+                min_col=start + 1,
+                max_col=max(indexes, default=0) + 1,
+                values_only=True,
+            )
+            return [
+                {c: _cell_value(row[i], as_str) for c, i in zip(columns, offsets)}
+                for row in rows
+            ]
+
+        return await to_thread.run_sync(load) if indexes else []
+    finally:
+        wb.close()
+
+
+async def iter_xls(
+    file: FileLike, chunk_size=1000, as_str=False, sheet_name: str | int = 0
+) -> AsyncGenerator[list[dict], None]:
+    """Similar like `load_xls`, but yield rows chunk by chunk, so that large
+    workbook can be processed before the whole sheet is parsed.
+    The sheet is read in read-only mode by a worker thread.
+
+    Usage::
+        >>> async for rows in iter_xls('users.xlsx', 5000):
+        ...     await save(rows)
+
+    :param chunk_size: max number of rows (dict) of each chunk
+    :param sheet_name: name or index of the sheet
+    """
+    wb = await _open_workbook(file)
+    try:
+        ws = _get_sheet(wb, sheet_name)
+        rows = ws.iter_rows(values_only=True)
+        header = await to_thread.run_sync(next, rows, None)
+        if header is None:
+            return
+        cols = _columns(header)
+        while chunk := await to_thread.run_sync(lambda: list(islice(rows, chunk_size))):
+            yield [
+                dict(zip(cols, (_cell_value(v, as_str) for v in row))) for row in chunk
+            ]
+    finally:
+        wb.close()
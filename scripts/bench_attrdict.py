@@ -0,0 +1,64 @@
+"""Compare construction and access cost of AttrDict with the eager one it replaced
+
+Usage::
+    python scripts/bench_attrdict.py
+    python scripts/bench_attrdict.py --keys 1000 --depth 3 --number 100
+"""
+
+import argparse
+import timeit
+from typing import Any
+
+from asyncur import AttrDict
+
+
+class EagerAttrDict(dict):
+    """The previous implementation: copy nested dicts and set attributes in init"""
+
+    def __init__(self, *args, **kw) -> None:
+        super().__init__(*args, **kw)
+        exclude = set(dir(self)) | set(self.__dict__)
+        for k, v in self.items():
+            if not isinstance(k, str) or k in exclude:
+                continue
+            if isinstance(v, dict):
+                v = self.__class__(v)
+            self.__dict__.setdefault(k, v)
+
+
+def make_payload(keys: int, depth: int) -> dict[str, Any]:
+    data: dict[str, Any] = {f"k{i}": i for i in range(keys)}
+    if depth > 1:
+        data["nested"] = make_payload(keys, depth - 1)
+    return data
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--keys", type=int, default=100)
+    parser.add_argument("--depth", type=int, default=3)
+    parser.add_argument("--number", type=int, default=1000)
+    args = parser.parse_args()
+    payload = make_payload(args.keys, args.depth)
+    path = ["nested"] * (args.depth - 1)
+
+    def access(d: Any) -> Any:
+        for name in path:
+            d = getattr(d, name)
+        return d.k0
+
+    print("class".ljust(16), *(c.rjust(16) for c in ("init(us)", "access(us)")))
+    for cls in (EagerAttrDict, AttrDict):
+        d = cls(payload)
+        costs = [
+            timeit.timeit(lambda: cls(payload), number=args.number),
+            timeit.timeit(lambda: access(d), number=args.number),
+        ]
+        print(
+            cls.__name__.ljust(16),
+            *(f"{c / args.number * 1e6:,.2f}".rjust(16) for c in costs),
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Report rows/sec of importing excel rows to local redis by `xls_to_redis`
+
+Usage::
+    python scripts/bench_xls_redis.py
+    python scripts/bench_xls_redis.py --rows 1000000 --chunk-size 5000
+"""
+
+import argparse
+import time
+from io import BytesIO
+
+from openpyxl import Workbook
+
+from asyncur import AsyncRedis, run
+from asyncur.importer import xls_to_redis
+
+PREFIX = "bench:xls"
+
+
+def make_workbook(rows: int) -> bytes:
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet()
+    ws.append(["id", "name", "city", "score"])
+    for i in range(rows):
+        ws.append([i, f"user{i}", f"city{i % 10}", i % 100])
+    buf = BytesIO()
+    wb.save(buf)
+    return buf.getvalue()
+
+
+async def bench(
+    content: bytes, chunk_size: int, max_in_flight: int
+) -> tuple[int, float]:
+    async with AsyncRedis() as redis:
+        start = time.perf_counter()
+        total = await xls_to_redis(
+            redis,
+            content,
+            PREFIX + ":user:{id}",
+            [PREFIX + ":city:{city}"],
+            chunk_size=chunk_size,
+            max_in_flight=max_in_flight,
+        )
+        cost = time.perf_counter() - start
+        keys = [k async for k in redis.scan_iter(PREFIX + ":*", count=10_000)]
+        for i in range(0, len(keys), 10_000):
+            await redis.unlink(*keys[i : i + 10_000])
+    return total, cost
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--max-in-flight", type=int, default=4)
+    args = parser.parse_args()
+    content = make_workbook(args.rows)
+    total, cost = run(bench, content, args.chunk_size, args.max_in_flight)
+    print(f"Imported {total:,} rows in {cost:.2f}s: {total / cost:,.0f} rows/sec")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,11 @@
+#!/usr/bin/env bash
+# Show total import time of asyncur and the slowest modules it imports.
+# Usage: ./scripts/importtime.sh [number of modules to show, default 20]
+
+set -e
+[ -f ../pyproject.toml ] && cd ..
+
+poetry run python -X importtime -c 'import asyncur' 2> importtime.log
+grep -E '\| asyncur$' importtime.log
+sort -t'|' -k2 -n -r importtime.log | head -n "${1:-20}"
+rm -f importtime.log
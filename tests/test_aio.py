@@ -1,5 +1,9 @@
 import asyncio
 import functools
+import importlib.util
+import math
+import threading
+import time
 from contextlib import asynccontextmanager
 from datetime import datetime
 from typing import Any
@@ -7,7 +11,22 @@ from typing import Any
 import anyio
 import pytest
 
-from asyncur.aio import bulk_gather, gather, run, run_async, start_tasks, wait_for
+from asyncur.aio import (
+    TIMED_OUT,
+    Progress,
+    as_completed,
+    blocking_portal,
+    bulk_gather,
+    bulk_run_sync,
+    gather,
+    resolve_backend,
+    run,
+    run_async,
+    start_portal,
+    start_tasks,
+    stop_portal,
+    wait_for,
+)
 from asyncur.exceptions import ParamsError
 from asyncur.timing import Timer
 
@@ -39,6 +58,120 @@ def test_run():
     assert run(foo, 2, backend="asyncio", backend_options=None) == 2
 
 
+def test_auto_backend(monkeypatch):
+    async def loop_name():
+        return type(asyncio.get_running_loop()).__module__
+
+    assert resolve_backend("asyncio") == ("asyncio", None)
+    assert resolve_backend("trio", {"a": 1}) == ("trio", {"a": 1})
+    assert resolve_backend("auto", {"use_uvloop": False}) == (
+        "asyncio",
+        {"use_uvloop": False},
+    )
+    assert run(loop_name, backend="auto", backend_options={"use_uvloop": False}) == (
+        "asyncio.unix_events"
+    )
+    monkeypatch.setattr(importlib.util, "find_spec", lambda name: None)
+    assert resolve_backend("auto") == ("asyncio", {})
+    assert run_async(loop_name, backend="auto") == "asyncio.unix_events"
+
+
+class TestPortal:
+    @staticmethod
+    async def current_loop(sth: Any = None) -> tuple[int, Any, Any]:
+        return threading.get_ident(), asyncio.get_running_loop(), sth
+
+    def test_blocking_portal(self):
+        thread_id, loop, _ = run(self.current_loop)
+        assert thread_id == threading.get_ident()
+        assert run(self.current_loop)[1] is not loop
+        with blocking_portal():
+            thread_id, loop, _ = run(self.current_loop)
+            assert thread_id != threading.get_ident()
+            assert run(self.current_loop, 1) == (thread_id, loop, 1)
+            assert run(self.current_loop(2)) == (thread_id, loop, 2)
+            assert run_async(self.current_loop) == (thread_id, loop, None)
+            assert run_async(self.current_loop(3)) == (thread_id, loop, 3)
+            with blocking_portal():
+                assert run(self.current_loop)[1] is not loop
+            assert run(self.current_loop)[1] is loop
+        assert run(self.current_loop)[0] == threading.get_ident()
+
+    def test_start_portal(self):
+        portal = start_portal()
+        assert start_portal() is portal
+        try:
+            thread_id, loop, _ = run(self.current_loop)
+            assert thread_id != threading.get_ident()
+            assert run_async(self.current_loop)[1] is loop
+        finally:
+            stop_portal()
+        stop_portal()
+        assert run(self.current_loop)[0] == threading.get_ident()
+
+    def test_threads(self):
+        # Each thread has its own `blocking_portal`, exits in any order
+        entered, a_exited = threading.Barrier(2), threading.Event()
+        results: dict[str, list] = {"a": [], "b": []}
+
+        def worker(name: str) -> None:
+            with blocking_portal():
+                entered.wait()
+                loop = run(self.current_loop)[1]
+                if name == "b":
+                    a_exited.wait()
+                results[name] += [loop, run(self.current_loop)[1]]
+            if name == "a":
+                a_exited.set()
+            results[name].append(run(self.current_loop)[0])
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in "ab"]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        (a1, a2, a_tid), (b1, b2, b_tid) = results["a"], results["b"]
+        assert a1 is a2 and b1 is b2 and a1 is not b1
+        assert a_tid == threads[0].ident and b_tid == threads[1].ident
+        assert run(self.current_loop)[0] == threading.get_ident()
+
+        # Process level portal is the fallback of threads, and safe to start
+        portals: list = []
+        starters = [
+            threading.Thread(target=lambda: portals.append(start_portal()))
+            for _ in range(5)
+        ]
+        for t in starters:
+            t.start()
+        for t in starters:
+            t.join()
+        try:
+            assert len(set(map(id, portals))) == 1
+            loop = run(self.current_loop)[1]
+            with blocking_portal():
+                assert run(self.current_loop)[1] is not loop
+            assert run(self.current_loop)[1] is loop
+            thread = threading.Thread(
+                target=lambda: portals.append(run(self.current_loop))
+            )
+            thread.start()
+            thread.join()
+            assert portals[-1][1] is loop
+        finally:
+            stop_portal()
+
+    def test_speed(self):
+        total = 200
+        with Timer("New loop for each call:", 4):
+            assert [run(self.current_loop, i)[2] for i in range(total)] == list(
+                range(total)
+            )
+        with Timer("Reuse loop by portal:", 4), blocking_portal():
+            assert [run(self.current_loop, i)[2] for i in range(total)] == list(
+                range(total)
+            )
+
+
 @pytest.mark.anyio
 async def test_wait_for():
     async def do_sth(seconds=0.2):
@@ -156,6 +289,44 @@ class TestGather:
             results = await bulk_gather(tasks, limit=MockServer.limit, wait_last=True)
             assert all(i == MockServer.OK for i in results)
 
+    @pytest.mark.anyio
+    async def test_bulk_limiter(self):
+        total = 200
+        tasks = [MockServer.response() for _ in range(total)]
+        limiter = anyio.CapacityLimiter(MockServer.limit)
+        results = await bulk_gather(tasks, limiter=limiter)
+        assert all(i == MockServer.OK for i in results)
+        tasks = [MockServer.response() for _ in range(total)]
+        results = await bulk_gather(tasks, MockServer.limit * 2, limiter=limiter)
+        assert all(i == MockServer.OK for i in results)
+
+    @pytest.mark.anyio
+    async def test_timeout(self):
+        async def delay(seconds):
+            await anyio.sleep(seconds)
+            return seconds
+
+        start = time.monotonic()
+        results = await gather(delay(0.1), delay(1), delay(0.2), timeout=0.3)
+        assert time.monotonic() - start < 0.5
+        assert results == (0.1, TIMED_OUT, 0.2)
+        assert not TIMED_OUT and repr(TIMED_OUT) == "TIMED_OUT"
+        assert await gather(delay(0.1), timeout=1) == (0.1,)
+        coros = [delay(i / 10) for i in (1, 1, 5, 1, 1)]
+        results = await bulk_gather(coros, 2, wait_last=True, timeout=0.3)
+        assert results == (0.1, 0.1, TIMED_OUT, 0.1, TIMED_OUT)
+        coros = [delay(i / 10) for i in (1, 5, 1, 1)]
+        results = await bulk_gather(coros, 2, timeout=0.35)
+        assert results == (0.1, TIMED_OUT, 0.1, 0.1)
+        limiter = anyio.CapacityLimiter(1)
+        coros = [delay(i / 10) for i in (1, 1, 5, 1)]
+        results = await bulk_gather(coros, limiter=limiter, timeout=0.3)
+        assert results == (0.1, 0.1, TIMED_OUT, TIMED_OUT)
+        with pytest.raises(ValueError):
+            await bulk_gather(
+                [delay(1), self.raise_error_later(0.1, ValueError)], timeout=0.5
+            )
+
     @pytest.mark.anyio
     async def test_bulk_conflict_or_warning(self):
         tasks = [MockServer.response() for _ in range(200)]
@@ -169,6 +340,148 @@ class TestGather:
             )
 
 
+class TestAsCompleted:
+    @staticmethod
+    async def delay(seconds, value):
+        await anyio.sleep(seconds)
+        if isinstance(value, type):
+            raise value(seconds)
+        return value
+
+    @pytest.mark.anyio
+    async def test_order(self):
+        coros = [self.delay(0.3, "a"), self.delay(0.1, "b"), self.delay(0.2, KeyError)]
+        reports: list[Progress] = []
+        async with as_completed(coros, progress=reports.append) as completed:
+            results = [(i, r) async for i, r in completed]
+        assert [i for i, _ in results] == [1, 2, 0]
+        assert results[0] == (1, "b") and results[2] == (0, "a")
+        assert isinstance(results[1][1], KeyError)
+        assert len(reports) == 1
+        assert reports[0][:3] == (3, 2, 1) and reports[0].eta == 0
+        async with as_completed([]) as completed:
+            assert [i async for i in completed] == []
+
+    @pytest.mark.anyio
+    async def test_batch_size(self):
+        total = 200
+        tasks = [MockServer.response() for _ in range(total)]
+        reports: list[Progress] = []
+        start = time.monotonic()
+        with Timer("as_completed:"):
+            async with as_completed(
+                tasks, MockServer.limit, progress=reports.append, interval=0.15
+            ) as completed:
+                async for i, r in completed:
+                    assert r == MockServer.OK
+        assert 0.4 < time.monotonic() - start < 0.6
+        assert 2 <= len(reports) <= 4
+        assert [r.done for r in reports] == sorted(r.done for r in reports)
+        assert reports[-1].done == total and reports[-1].failed == 0
+        assert reports[0].eta > 0 and reports[0].rate > 0
+
+    @pytest.mark.anyio
+    async def test_progress_on_time(self):
+        reports: list[Progress] = []
+        coros = [self.delay(0.3, i) for i in range(3)]
+        async with as_completed(
+            coros, progress=reports.append, interval=0.05
+        ) as completed:
+            results = [r async for _, r in completed]
+        assert sorted(results) == [0, 1, 2]
+        # Reported while no coroutine finished yet
+        assert len(reports) >= 4
+        assert reports[0].done == 0 and reports[0].eta == float("inf")
+        assert reports[-1][:3] == (3, 3, 0)
+        with pytest.raises(ParamsError):
+            async with as_completed([], progress=print, interval=0):
+                pass
+
+    @pytest.mark.anyio
+    async def test_break_early(self):
+        finished = []
+
+        async def job(i):
+            await anyio.sleep(i / 10)
+            finished.append(i)
+            return i
+
+        async with as_completed([job(i) for i in range(5)]) as results:
+            async for i, _ in results:
+                if i == 1:
+                    break
+            after_loop = True
+        assert after_loop
+        await anyio.sleep(0.5)
+        assert finished == [0, 1]
+
+    @pytest.mark.anyio
+    async def test_raise_in_loop(self):
+        finished = []
+
+        async def job(i):
+            await anyio.sleep(i / 10)
+            finished.append(i)
+            return i
+
+        with pytest.raises(KeyError):
+            async with as_completed([job(i) for i in range(5)], 2) as results:
+                async for i, _ in results:
+                    if i == 1:
+                        raise KeyError(i)
+        await anyio.sleep(0.5)
+        assert finished == [0, 1]
+
+    def test_break_in_run(self):
+        # Code after the loop runs, and the event loop is not cancelled
+        async def main():
+            async with as_completed([self.delay(i / 10, i) for i in range(5)]) as rs:
+                async for i, _ in rs:
+                    break
+            await anyio.sleep(0.01)
+            return i
+
+        assert run(main) == 0
+
+
+class TestBulkRunSync:
+    @pytest.mark.anyio
+    async def test_thread(self):
+        items = list(range(100))
+        expected = tuple(math.isqrt(i) for i in items)
+        assert await bulk_run_sync(math.isqrt, items) == expected
+        assert await bulk_run_sync(math.isqrt, items, 3, chunk_size=7) == expected
+        assert await bulk_run_sync(math.isqrt, []) == ()
+
+        def blocking(seconds):
+            time.sleep(seconds)
+            return seconds
+
+        with Timer("Sleep in threads:"):
+            start = time.monotonic()
+            results = await bulk_run_sync(blocking, [0.1] * 20, 10, chunk_size=1)
+            assert results == (0.1,) * 20
+            assert 0.2 <= time.monotonic() - start < 0.3
+
+    @pytest.mark.anyio
+    async def test_process(self):
+        items = list(range(1000))
+        expected = tuple(math.isqrt(i) for i in items)
+        results = await bulk_run_sync(math.isqrt, items, 2, mode="process")
+        assert results == expected
+
+    @pytest.mark.anyio
+    async def test_raises(self):
+        items = [4, -1, 9]
+        for mode in ("thread", "process"):
+            with pytest.raises(ValueError):
+                await bulk_run_sync(math.isqrt, items, mode=mode)  # type:ignore[arg-type]
+        results = await bulk_run_sync(math.isqrt, items, chunk_size=1, raises=False)
+        assert results[1] is None
+        with pytest.raises(ParamsError):
+            await bulk_run_sync(math.isqrt, items, mode="x")  # type:ignore[arg-type]
+
+
 class TestStartTasks:
     root = anyio.Path(__file__).parent
     names = ("tmp.txt", "tmp2.txt", "tmp3.txt")
@@ -0,0 +1,18 @@
+from asyncur.benchmark import BACKENDS, benchmark, is_available, show
+
+from .test_timing import capture_stdout
+
+
+def test_benchmark():
+    results = benchmark(["asyncio", "not-exist"], tasks=200, background=2)
+    assert list(results) == ["asyncio"]
+    assert all(v > 0 for v in results["asyncio"].values())
+    available = [name for name in BACKENDS if is_available(name)]
+    assert "asyncio" in available
+    assert list(benchmark(tasks=200, background=2)) == available
+    with capture_stdout() as stream:
+        show(results)
+        show({})
+    stdout = stream.getvalue()
+    assert "asyncio" in stdout and "gather tasks/s" in stdout
+    assert "No available backend" in stdout
@@ -0,0 +1,116 @@
+import anyio
+import pytest
+
+from asyncur import alru_cache, gather
+from asyncur.aio import bulk_gather
+from asyncur.cache import CacheInfo
+from asyncur.exceptions import ParamsError
+
+
+@pytest.mark.anyio
+async def test_single_flight():
+    calls = []
+
+    @alru_cache
+    async def fetch(key, scale=1):
+        calls.append(key)
+        await anyio.sleep(0.05)
+        return key * scale
+
+    assert await gather(*[fetch(i % 2) for i in range(10)]) == (0, 1) * 5
+    assert calls == [0, 1]
+    assert fetch.cache_info() == CacheInfo(8, 2, 0, 128, 2)
+    assert await fetch(1) == 1
+    assert await fetch(1, scale=2) == await fetch(1, 2) == 2
+    assert calls == [0, 1, 1, 1]
+    assert fetch.cache_invalidate(1)
+    assert not fetch.cache_invalidate(3)
+    fetch.cache_clear()
+    assert fetch.cache_info() == CacheInfo(0, 0, 0, 128, 0)
+    assert fetch.__name__ == "fetch"  # type:ignore[attr-defined]
+
+
+@pytest.mark.anyio
+async def test_evict():
+    calls = []
+
+    @alru_cache(maxsize=2, ttl=0.1)
+    async def double(n):
+        calls.append(n)
+        return n * 2
+
+    for n in (1, 2, 1, 3, 1, 2):
+        await double(n)
+    # 2 was evicted by LRU when 3 comes
+    assert calls == [1, 2, 3, 2]
+    assert double.cache_info() == CacheInfo(2, 4, 2, 2, 2)
+    await anyio.sleep(0.1)
+    await double(1)
+    assert calls[-1] == 1
+    assert double.cache_info().evictions == 3
+
+    @alru_cache(typed=True)
+    async def identity(n):
+        calls.append(n)
+        return n
+
+    await identity(1)
+    await identity(1.0)
+    assert identity.cache_info().misses == 2
+
+    with pytest.raises(ParamsError):
+        alru_cache(maxsize=-1)(identity)
+    with pytest.raises(ParamsError):
+        alru_cache(ttl=0)(identity)
+
+
+@pytest.mark.anyio
+async def test_error_and_cancel():
+    calls = 0
+
+    @alru_cache
+    async def flaky(n):
+        nonlocal calls
+        calls += 1
+        await anyio.sleep(0.05)
+        if calls == 1:
+            raise ValueError(n)
+        return n
+
+    results = await bulk_gather([flaky(1), flaky(1)], raises=False)
+    assert calls == 1
+    assert results == (None, None)
+    # Exceptions are not cached
+    assert await flaky(1) == 1
+    assert calls == 2
+
+    values: list[int] = []
+
+    async def wait_flaky():
+        values.append(await flaky(2))
+
+    async with anyio.create_task_group() as tg:
+        with anyio.move_on_after(0.01):
+            tg.start_soon(wait_flaky)
+            await flaky(2)
+    # Waiter takes over the flight when the caller is cancelled
+    assert values == [2]
+    assert calls == 4
+
+
+class Repo:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    @alru_cache
+    async def get(self, key):
+        self.calls += 1
+        return key
+
+
+@pytest.mark.anyio
+async def test_method():
+    repo = Repo()
+    assert await repo.get(1) == await repo.get(1) == 1
+    assert repo.calls == 1
+    assert repo.get.cache_info().hits == 1
@@ -1,10 +1,18 @@
 import os
+from unittest.mock import AsyncMock
 
 import pytest
 from asgi_lifespan import LifespanManager
+from fastapi import FastAPI, Request
 from httpx import ASGITransport, AsyncClient
+from redis.asyncio.client import Pipeline
+from redis.asyncio.cluster import ClusterNode
+from redis.asyncio.sentinel import SentinelConnectionPool
+from redis.exceptions import ResponseError
 
-from asyncur import AsyncRedis
+from asyncur import AsyncRedis, AsyncRedisCluster, AttrDict
+from asyncur.client import parse_nodes
+from asyncur.exceptions import ParamsError
 
 from .main import app
 
@@ -34,3 +42,126 @@ async def test_apis(client):
     assert r.json()["b"] == "1"
     os.environ["REDIS_HOST"] = "localhost"
     await AsyncRedis().get("b") == b"1"
+
+
+class TestClusterAndSentinel:
+    def test_cluster(self):
+        app = FastAPI()
+        redis = AsyncRedis(app, cluster=True, host="localhost")
+        assert isinstance(redis, AsyncRedisCluster)
+        assert app.state.redis is redis
+        request = Request({"type": "http", "app": app})
+        assert AsyncRedis(request) is redis
+        assert AsyncRedisCluster(request) is redis
+        startup_nodes = [ClusterNode("localhost", 7000)]
+        assert isinstance(AsyncRedis(startup_nodes=startup_nodes), AsyncRedisCluster)
+        assert isinstance(AsyncRedis(), AsyncRedis)
+
+    def test_cluster_env(self, monkeypatch):
+        monkeypatch.setenv("REDIS_CLUSTER_NODES", "127.0.0.1:7000,127.0.0.1:7001")
+        redis = AsyncRedis()
+        assert isinstance(redis, AsyncRedisCluster)
+        assert list(redis.nodes_manager.startup_nodes) == [
+            "127.0.0.1:7000",
+            "127.0.0.1:7001",
+        ]
+        assert isinstance(AsyncRedis(cluster=False), AsyncRedis)
+
+    def test_sentinel(self, monkeypatch):
+        app = FastAPI()
+        redis = AsyncRedis(app, sentinels=[("localhost", 26379)], db=1)
+        pool = redis.connection_pool
+        assert isinstance(pool, SentinelConnectionPool)
+        assert pool.service_name == "mymaster"
+        assert pool.connection_kwargs["db"] == 1
+        request = Request({"type": "http", "app": app})
+        assert AsyncRedis(request) is redis
+        assert redis.connection_pool is pool
+        monkeypatch.setenv("REDIS_SENTINELS", "localhost:26379, localhost:26380")
+        monkeypatch.setenv("REDIS_SENTINEL_SERVICE", "master2")
+        redis = AsyncRedis()
+        assert redis.connection_pool.service_name == "master2"
+        assert redis._sentinel is not None
+        assert len(redis._sentinel.sentinels) == 2
+
+    def test_parse_nodes(self):
+        assert parse_nodes("") == []
+        assert parse_nodes("a:1, b:2,") == [("a", 1), ("b", 2)]
+
+
+@pytest.mark.anyio
+async def test_metrics():
+    async with AsyncRedis(metrics=True) as redis:
+        assert redis.metrics is not None
+        await redis.set("asyncur:test:metrics", "hello")
+        assert await redis.get("asyncur:test:metrics") == b"hello"
+        with pytest.raises(ResponseError):
+            await redis.incr("asyncur:test:metrics")
+        async with redis.pipeline(transaction=False) as pipe:
+            pipe.get("asyncur:test:metrics").exists("asyncur:test:metrics")
+            assert await pipe.execute() == [b"hello", 1]
+        await redis.delete("asyncur:test:metrics")
+        snapshot = redis.metrics.snapshot()
+    commands = snapshot["commands"]
+    assert commands["GET"]["count"] == 1
+    assert commands["GET"]["bytes_out"] == len("asyncur:test:metrics")
+    assert commands["GET"]["bytes_in"] == len("hello")
+    assert commands["SET"]["bytes_out"] == len("asyncur:test:metricshello")
+    assert commands["INCRBY"]["errors"] == 1
+    assert snapshot["pipelines"]["count"] == 1
+    assert snapshot["pipelines"]["bytes_in"] == len("hello") + 1
+    assert snapshot["pipeline_size"]["max"] == 2
+    assert snapshot["get_connection"]["count"] >= 5
+    assert AsyncRedis().metrics is None
+    assert isinstance(AsyncRedis().pipeline(), Pipeline)
+
+
+@pytest.mark.anyio
+async def test_json():
+    async with AsyncRedis() as redis:
+        value = {"a": {"b": [{"c": 1}]}, "keys": "k"}
+        await redis.set_json("asyncur:json", value, ex=10)
+        d = await redis.get_json("asyncur:json")
+        assert isinstance(d, AttrDict) and d == value
+        assert d.a.b[0].c == 1
+        assert d["keys"] == "k"
+        assert await redis.get_json("asyncur:json:none") is None
+        assert await redis.mget_json(["asyncur:json", "asyncur:json:none"]) == [
+            value,
+            None,
+        ]
+        await redis.delete("asyncur:json")
+
+
+class TestClusterCommands:
+    @pytest.mark.anyio
+    async def test_mget_mset(self, monkeypatch):
+        redis = AsyncRedis(cluster=True, host="localhost")
+        mget = AsyncMock(return_value=[b"1", None])
+        mset = AsyncMock(return_value=[True, True])
+        monkeypatch.setattr(redis, "mget_nonatomic", mget)
+        monkeypatch.setattr(redis, "mset_nonatomic", mset)
+        assert await redis.mget(["a", "b"]) == [b"1", None]
+        mget.assert_awaited_once_with(["a", "b"])
+        assert await redis.mget("a", "b") == [b"1", None]
+        mget.assert_awaited_with("a", "b")
+        assert await redis.mset({"a": 1, "b": 2}) is True
+        mset.assert_awaited_once_with({"a": 1, "b": 2})
+        mset.return_value = [True, False]
+        assert await redis.mset({"a": 1}) is False
+
+    def test_sentinel_options(self, monkeypatch):
+        with pytest.raises(ParamsError):
+            AsyncRedis(cluster=True, sentinels=[("localhost", 26379)])
+        monkeypatch.setenv("REDIS_CLUSTER_NODES", "127.0.0.1:7000")
+        with pytest.raises(ParamsError):
+            AsyncRedis(service_name="mymaster")
+        # Unset options are ignored
+        assert isinstance(AsyncRedis(sentinels=None), AsyncRedisCluster)
+
+    def test_metrics_ignored(self, monkeypatch):
+        monkeypatch.setenv("REDIS_CLUSTER_NODES", "127.0.0.1:7000")
+        with pytest.warns(UserWarning, match="Metrics"):
+            redis = AsyncRedis(FastAPI(), metrics=True)
+        assert isinstance(redis, AsyncRedisCluster)
+        assert isinstance(AsyncRedis(metrics=False), AsyncRedisCluster)
@@ -0,0 +1,62 @@
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+from openpyxl import Workbook
+
+from asyncur import AsyncRedis
+from asyncur.exceptions import ParamsError
+from asyncur.importer import xls_to_redis
+
+
+@pytest.mark.anyio
+async def test_xls_to_redis():
+    demo = Path(__file__).parent / "demo.xlsx"
+    async with AsyncRedis(decode_responses=True) as redis:
+        keys = ["asyncur:row:0", "asyncur:row:1", "asyncur:rows:1", "asyncur:rows:2"]
+        await redis.delete(*keys)
+        total = await xls_to_redis(
+            redis,
+            demo,
+            "asyncur:row:{_index}",
+            ["asyncur:rows:{Column 3}"],
+            chunk_size=1,
+            max_in_flight=2,
+        )
+        assert total == 2
+        assert await redis.hgetall("asyncur:row:0") == {
+            "Column1": "row1-\\t%c",
+            "Column2\nMultiLines": "0",
+            "Column 3": "1",
+            "4": "",
+        }
+        assert await redis.hget("asyncur:row:1", "Column2\nMultiLines") == "r2 c2"
+        assert await redis.smembers("asyncur:rows:1") == {"asyncur:row:0"}
+        assert await redis.smembers("asyncur:rows:2") == {"asyncur:row:1"}
+        await redis.delete(*keys)
+        with pytest.raises(KeyError):
+            await xls_to_redis(redis, demo, "asyncur:row:{missing}")
+
+
+def make_xlsx(*rows: list) -> bytes:
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet()
+    for row in rows:
+        ws.append(row)
+    buf = BytesIO()
+    wb.save(buf)
+    return buf.getvalue()
+
+
+@pytest.mark.anyio
+async def test_column_named_index():
+    content = make_xlsx(["index", "name"], ["a1", "x"], ["a2", "y"])
+    async with AsyncRedis(decode_responses=True) as redis:
+        keys = ["asyncur:idx:a1:0", "asyncur:idx:a2:1"]
+        await redis.delete(*keys)
+        # Column `index` is not overridden by the row number
+        assert await xls_to_redis(redis, content, "asyncur:idx:{index}:{_index}") == 2
+        assert await redis.hgetall(keys[1]) == {"index": "a2", "name": "y"}
+        await redis.delete(*keys)
+        with pytest.raises(ParamsError):
+            await xls_to_redis(redis, make_xlsx(["_index"], [1]), "asyncur:{_index}")
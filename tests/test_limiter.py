@@ -0,0 +1,44 @@
+import time
+
+import anyio
+import pytest
+
+from asyncur import AsyncRedis
+from asyncur.aio import bulk_gather
+from asyncur.exceptions import ParamsError
+from asyncur.limiter import RedisRateLimiter
+
+
+def test_invalid_params():
+    redis = AsyncRedis()
+    with pytest.raises(ParamsError):
+        RedisRateLimiter(redis, "k", rate=0)
+    with pytest.raises(ParamsError):
+        RedisRateLimiter(redis, "k", rate=1, period=0)
+    with pytest.raises(ParamsError):
+        RedisRateLimiter(redis, "k", rate=10, prefetch=11)
+
+
+@pytest.mark.anyio
+async def test_rate_limit():
+    key = "asyncur:test:rate-limiter"
+    async with AsyncRedis() as redis:
+        await redis.delete(key)
+        limiter = RedisRateLimiter(redis, key, rate=20, period=0.5, prefetch=5)
+        other = RedisRateLimiter(redis, key, rate=20, period=0.5, prefetch=5)
+
+        async def job(i):
+            await anyio.sleep(0)
+            return i
+
+        start = time.time()
+        results = await bulk_gather(
+            [job(i) for i in range(30)], limiter=limiter
+        ) + await bulk_gather([job(i) for i in range(30)], limiter=other)
+        cost = time.time() - start
+        assert results == tuple(range(30)) * 2
+        # 20 tokens at first, then 40 tokens per second for the rest 40
+        assert 0.9 < cost < 2
+        granted, wait = await limiter.take(1)
+        assert granted == 0 and wait > 0
+        await redis.delete(key)
@@ -0,0 +1,95 @@
+import anyio
+import pytest
+
+from asyncur.exceptions import ParamsError
+from asyncur.pipeline import Pipeline
+
+
+async def numbers(total: int):
+    for i in range(total):
+        yield i
+
+
+@pytest.mark.anyio
+async def test_stages():
+    async def double(n: int) -> int:
+        await anyio.sleep(0.01)
+        return n * 2
+
+    items = await (
+        Pipeline(range(20), buffer=2)
+        .map(double, concurrency=5)
+        .map(str)
+        .batch(3)
+        .flatten()
+        .collect()
+    )
+    assert sorted(items, key=int) == [str(i * 2) for i in range(20)]
+    assert await Pipeline(numbers(7)).batch(3).collect() == [
+        [0, 1, 2],
+        [3, 4, 5],
+        [6],
+    ]
+    assert await Pipeline([]).batch(3).run() == 0
+
+    received = []
+
+    async def sink(batch: list) -> None:
+        received.append(batch)
+
+    assert await Pipeline(range(10)).batch(4).run(sink, concurrency=2) == 3
+    assert sorted(received) == [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]]
+
+
+@pytest.mark.anyio
+async def test_batch_max_wait():
+    async def slow_source():
+        for i in range(5):
+            yield i
+            await anyio.sleep(0.04 if i == 1 else 0)
+
+    start = anyio.current_time()
+    batches = []
+
+    def sink(batch: list) -> None:
+        batches.append((batch, anyio.current_time() - start))
+
+    await Pipeline(slow_source()).batch(10, max_wait=0.02).run(sink)
+    assert [b for b, _ in batches] == [[0, 1], [2, 3, 4]]
+    assert 0.02 <= batches[0][1] < 0.04
+
+
+@pytest.mark.anyio
+async def test_backpressure():
+    produced = 0
+
+    async def source():
+        nonlocal produced
+        for i in range(100):
+            produced += 1
+            yield i
+
+    async def slow_sink(item: int) -> None:
+        await anyio.sleep(0.01)
+        # Items in flight are bounded by buffers, not by the size of source
+        assert produced - item <= 8
+
+    await Pipeline(source(), buffer=2).map(lambda i: i).run(slow_sink)
+    assert produced == 100
+
+
+@pytest.mark.anyio
+async def test_errors():
+    def check(n: int) -> int:
+        if n == 3:
+            raise ValueError(n)
+        return n
+
+    with pytest.raises(ValueError):
+        await Pipeline(range(10)).map(check, concurrency=2).run()
+    with pytest.raises(ParamsError):
+        Pipeline(range(3), buffer=-1)
+    with pytest.raises(ParamsError):
+        Pipeline(range(3)).map(check, concurrency=0)
+    with pytest.raises(ParamsError):
+        Pipeline(range(3)).batch(0)
@@ -0,0 +1,118 @@
+import anyio
+import pytest
+
+from asyncur import AsyncRedis, start_tasks
+from asyncur.exceptions import ParamsError
+from asyncur.streams import StreamConsumer
+
+
+async def noop(entry_id, fields):
+    pass
+
+
+def test_invalid_params():
+    with pytest.raises(ParamsError):
+        StreamConsumer(AsyncRedis(), "s", "g", "c", noop, batch_size=0)
+    with pytest.raises(ParamsError):
+        StreamConsumer(AsyncRedis(), "s", "g", "c", noop, concurrency=0)
+    with pytest.raises(ParamsError, match="ack_size"):
+        StreamConsumer(AsyncRedis(), "s", "g", "c", noop, ack_size=0)
+    for block in (0, -1):
+        with pytest.raises(ParamsError):
+            StreamConsumer(AsyncRedis(), "s", "g", "c", noop, block=block)
+    with pytest.raises(ParamsError):
+        StreamConsumer(AsyncRedis(), "s", "g", "c", noop, max_deliveries=0)
+
+
+@pytest.mark.anyio
+async def test_consume():
+    stream, group = "asyncur:test:stream", "group"
+    total = 500
+    received: dict = {}
+    running = max_running = 0
+
+    async def handle(entry_id, fields):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await anyio.sleep(0.01)
+        running -= 1
+        if fields[b"i"] == b"13":
+            raise ValueError(fields)
+        received[entry_id] = fields
+
+    async with AsyncRedis() as redis:
+        await redis.delete(stream)
+        consumer = StreamConsumer(
+            redis, stream, group, "c1", handle, batch_size=50, concurrency=20
+        )
+        async with start_tasks(consumer.run):
+            async with redis.pipeline(transaction=False) as pipe:
+                for i in range(total):
+                    pipe.xadd(stream, {"i": i})
+                await pipe.execute()
+            with anyio.fail_after(5):
+                while consumer.processed + consumer.failed < total:
+                    await anyio.sleep(0.05)
+            await consumer.stop()
+        assert len(received) == consumer.processed == total - 1
+        assert consumer.failed == 1
+        assert max_running == 20
+        pending = await redis.xpending(stream, group)
+        assert pending["pending"] == 1
+
+        # The failed entry is reclaimed by another consumer after idle
+        await anyio.sleep(0.1)
+        retried = []
+
+        async def handle_again(entry_id, fields):
+            retried.append(fields)
+
+        other = StreamConsumer(
+            redis, stream, group, "c2", handle_again, block=0.1, claim_idle=0.05
+        )
+        async with start_tasks(other.run):
+            with anyio.fail_after(5):
+                while not retried:
+                    await anyio.sleep(0.05)
+        assert retried == [{b"i": b"13"}]
+        assert (await redis.xpending(stream, group))["pending"] == 0
+        await redis.delete(stream)
+
+
+@pytest.mark.anyio
+async def test_max_deliveries():
+    stream, group, dlq = "asyncur:test:poison", "group", "asyncur:test:dlq"
+    calls = 0
+
+    async def always_fail(entry_id, fields):
+        nonlocal calls
+        calls += 1
+        raise ValueError(fields)
+
+    async with AsyncRedis() as redis:
+        await redis.delete(stream, dlq)
+        consumer = StreamConsumer(
+            redis,
+            stream,
+            group,
+            "c1",
+            always_fail,
+            block=0.0001,  # Less than 1ms is still a short block, not forever
+            claim_idle=0.02,
+            max_deliveries=3,
+            dead_letter=dlq,
+        )
+        await consumer.create_group()
+        entry_id = await redis.xadd(stream, {"i": 1})
+        async with start_tasks(consumer.run):
+            with anyio.fail_after(5):
+                while not consumer.dead:
+                    await anyio.sleep(0.02)
+            await consumer.stop()
+        assert calls == consumer.failed == 3
+        assert consumer.dead == 1
+        assert (await redis.xpending(stream, group))["pending"] == 0
+        assert [fields for _, fields in await redis.xrange(dlq)] == [{b"i": b"1"}]
+        assert await consumer.deliveries([entry_id]) == {}
+        await redis.delete(stream, dlq)
@@ -0,0 +1,144 @@
+import anyio
+import pytest
+
+from asyncur.aio import start_tasks
+from asyncur.exceptions import HeartbeatTimeout, ParamsError
+from asyncur.supervisor import RestartPolicy, Supervisor, heartbeat
+
+
+@pytest.mark.anyio
+async def test_restart_crashed():
+    calls = []
+
+    async def crash():
+        calls.append(anyio.current_time())
+        raise ValueError(len(calls))
+
+    async def steady():
+        while True:
+            await anyio.sleep(0.01)
+
+    supervisor = Supervisor(max_restarts=2, backoff=0.05)
+    async with start_tasks(crash, steady, supervisor=supervisor):
+        await anyio.sleep(0.02)
+        assert supervisor.states["crash"].status == "restarting"
+        assert not supervisor.healthy
+        await anyio.sleep(0.3)
+        # Other tasks keep running after one gave up
+        assert supervisor.states["steady"].alive
+    assert len(calls) == 3
+    assert calls[2] - calls[1] >= 0.1 > calls[1] - calls[0] >= 0.05
+    state = supervisor.snapshot()["crash"]
+    assert state["status"] == "failed"
+    assert state["restarts"] == 2
+    assert state["last_error"] == "ValueError(3)"
+
+
+@pytest.mark.anyio
+async def test_reset_restarts():
+    runs: list[float] = []
+
+    async def flaky():
+        runs.append(anyio.current_time())
+        # Crash loop at first, then stay up long enough before each error
+        await anyio.sleep(0 if len(runs) <= 2 else 0.06)
+        if len(runs) < 7:
+            raise ConnectionError(len(runs))
+
+    supervisor = Supervisor(max_restarts=2, backoff=0.01, reset_after=0.05)
+    async with start_tasks(flaky, supervisor=supervisor):
+        with anyio.fail_after(2):
+            while supervisor.states["flaky"].status != "finished":
+                await anyio.sleep(0.01)
+    state = supervisor.states["flaky"]
+    # More errors than max_restarts, but never given up
+    assert len(runs) == 7
+    assert state.total_restarts == 6
+    assert state.restarts == 1
+    # Backoff starts over after a healthy run
+    assert runs[3] - runs[2] < 0.06 + 0.04
+
+
+@pytest.mark.anyio
+async def test_many_restarts():
+    runs = 0
+
+    async def crash_loop():
+        nonlocal runs
+        runs += 1
+        if runs <= 1100:
+            raise ConnectionError(runs)
+
+    supervisor = Supervisor(
+        max_restarts=None, backoff=0.5, max_backoff=0, reset_after=10
+    )
+    async with start_tasks(crash_loop, supervisor=supervisor):
+        with anyio.fail_after(5):
+            while supervisor.states["crash_loop"].status != "finished":
+                await anyio.sleep(0.01)
+    state = supervisor.states["crash_loop"]
+    assert runs == 1101
+    assert state.restarts == state.total_restarts == 1100
+
+
+@pytest.mark.anyio
+async def test_heartbeat():
+    runs = 0
+
+    async def consume():
+        nonlocal runs
+        runs += 1
+        for _ in range(3):
+            await anyio.sleep(0.01)
+            heartbeat()
+        if runs == 1:
+            await anyio.sleep(10)  # hung
+
+    supervisor = Supervisor(backoff=0)
+    task = supervisor.task(consume, heartbeat_timeout=0.1)
+    async with start_tasks(task, supervisor=supervisor):
+        await anyio.sleep(0.03)
+        assert supervisor.healthy
+        await anyio.sleep(0.3)
+    state = supervisor.states["consume"]
+    assert runs == 2
+    assert state.status == "finished" and state.alive
+    assert isinstance(state.last_error, HeartbeatTimeout)
+    assert state.policy == RestartPolicy(backoff=0, heartbeat_timeout=0.1)
+    assert supervisor.task(task) is task
+    heartbeat()  # no effect outside supervised tasks
+
+
+@pytest.mark.anyio
+async def test_query_from_thread():
+    async def consume():
+        while True:
+            await anyio.sleep(0.01)
+            heartbeat()
+
+    supervisor = Supervisor()
+    task = supervisor.task(consume, heartbeat_timeout=0.1)
+    async with start_tasks(task, supervisor=supervisor):
+        await anyio.sleep(0.02)
+        # e.g.: sync health endpoint that runs in threadpool
+        healthy = await anyio.to_thread.run_sync(lambda: supervisor.healthy)
+        snapshot = await anyio.to_thread.run_sync(supervisor.snapshot)
+    assert healthy
+    assert snapshot["consume"]["status"] == "running"
+    assert snapshot["consume"]["alive"]
+
+
+@pytest.mark.anyio
+async def test_invalid_task():
+    supervisor = Supervisor()
+
+    async def job():
+        pass
+
+    supervisor.task(job)
+    with pytest.raises(ParamsError):
+        supervisor.task(job)
+    coro = job()
+    with pytest.raises(ParamsError):
+        supervisor.task(coro)  # type:ignore[arg-type]
+    coro.close()
@@ -5,7 +5,7 @@ from io import StringIO
 import anyio
 import pytest
 
-from asyncur.timing import Timer, timeit
+from asyncur.timing import Histogram, Timer, timeit
 
 
 @contextmanager
@@ -167,3 +167,24 @@ async def test_with_timeit():
     assert raw_wait_for.__name__ not in stdout
     assert raw_sleep1.__name__ not in stdout
     assert message in stdout
+
+
+def test_histogram():
+    h = Histogram()
+    assert h.snapshot()["count"] == 0
+    assert h.quantile(0.5) == 0
+    for cost in (0.0001, 0.003, 0.003, 0.2, 20):
+        h.record(cost)
+    snapshot = h.snapshot()
+    assert snapshot["count"] == 5
+    assert snapshot["max"] == 20
+    assert round(snapshot["avg"], 4) == round((0.0061 + 20.2) / 5, 4)
+    assert snapshot["p50"] == 0.005
+    assert snapshot["p99"] == 20
+    assert snapshot["buckets"][0.0005] == 1
+    assert snapshot["buckets"][float("inf")] == 1
+    h.reset()
+    assert h.count == 0 and h.max == 0
+    sizes = Histogram((1, 10, 100))
+    sizes.record(50)
+    assert sizes.snapshot()["buckets"] == {1: 0, 10: 0, 100: 1, float("inf"): 0}
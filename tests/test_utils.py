@@ -1,4 +1,6 @@
 # mypy: disable-error-code="attr-defined"
+import pickle
+
 import pytest
 
 from asyncur import AttrDict
@@ -70,3 +72,37 @@ class TestAttrDict:
             d.e_f
         with pytest.raises(AttributeError):
             d.ef
+
+    def test_lazy(self):
+        origin = {"a": {"b": {"c": 1}}, "keys": 0}
+        d = AttrDict(origin)
+        assert d.__dict__ == {}
+        assert type(d["a"]) is dict
+        assert d.a is d.a is d["a"]
+        assert d.a.b is d.a.b is d["a"]["b"]
+        assert isinstance(d["a"]["b"], AttrDict)
+        # Wrapper is the one shared object
+        d["a"]["b"]["c"] = 2
+        assert d.a.b.c == 2
+        d.a["n"] = 3
+        assert d["a"]["n"] == 3
+        assert pickle.loads(pickle.dumps(d)).a.b.c == 2
+        assert origin == {"a": {"b": {"c": 1}}, "keys": 0}
+        assert str(d) == str({"a": {"b": {"c": 2}, "n": 3}, "keys": 0})
+        d["a"] = {"b": 2}
+        assert d.a.b == 2
+        d["x"] = {"y": 3}
+        assert d.x.y == 3
+        del d["x"]
+        with pytest.raises(AttributeError):
+            d.x
+        assert callable(d.keys)
+        assert d == origin | {"a": {"b": 2}}
+
+    def test_loads(self):
+        d = AttrDict.loads(b'{"a": {"b": [{"c": 1}]}, "keys": 2}')
+        assert d == {"a": {"b": [{"c": 1}]}, "keys": 2}
+        assert type(d["a"]) is AttrDict
+        assert d.a.b[0].c == 1
+        assert d["keys"] == 2
+        assert AttrDict.loads("[1, {}]") == [1, {}]
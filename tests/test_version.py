@@ -1,8 +1,26 @@
 import subprocess
+import sys
 
+import pytest
+
+import asyncur
 from asyncur import __version__
 
 
 def test_version():
     r = subprocess.run(["poetry", "version", "-s"], capture_output=True)
     assert r.stdout.decode().strip() == __version__
+
+
+def test_lazy_import():
+    code = (
+        "import sys, asyncur;"
+        "print(sorted({'redis', 'pandas', 'importlib.metadata'} & set(sys.modules)))"
+    )
+    r = subprocess.run([sys.executable, "-c", code], capture_output=True)
+    assert r.stdout.decode().strip() == "[]", r.stderr.decode()
+    assert asyncur.AsyncRedis.__module__ == "asyncur.client"
+    assert asyncur.xls.load_xls.__module__ == "asyncur.xls"
+    assert "xls" in dir(asyncur) and "AsyncRedisCluster" in dir(asyncur)
+    with pytest.raises(AttributeError, match="not_exists"):
+        asyncur.not_exists  # type:ignore[attr-defined]
@@ -1,9 +1,21 @@
+from io import BytesIO
 from pathlib import Path
 
 import anyio
 import pytest
+from openpyxl import Workbook
 
-from asyncur.xls import df_to_datas, load_xls, read_excel
+from asyncur.exceptions import ParamsError
+from asyncur.xls import (
+    count_rows,
+    df_to_datas,
+    iter_xls,
+    load_columns,
+    load_xls,
+    read_excel,
+    read_headers,
+    sheet_names,
+)
 
 
 @pytest.mark.anyio
@@ -24,3 +36,52 @@ async def test_read():
         {"Column1": "row1-\\t%c", "Column2\nMultiLines": "0", "Column 3": "1", 4: ""},
         {"Column1": "r2c1\n00", "Column2\nMultiLines": "r2 c2", "Column 3": "2", 4: ""},
     ]
+
+
+@pytest.mark.anyio
+async def test_iter_xls():
+    demo = Path(__file__).parent / "demo.xlsx"
+    data = await load_xls(demo)
+    chunks = [rows async for rows in iter_xls(demo, chunk_size=1)]
+    assert chunks == [[data[0]], [data[1]]]
+    chunks = [rows async for rows in iter_xls(demo.read_bytes(), as_str=True)]
+    assert chunks == [await load_xls(demo, True)]
+    chunks = [rows async for rows in iter_xls(demo, sheet_name="Sheet1")]
+    assert chunks == [data]
+
+
+@pytest.mark.anyio
+async def test_metadata():
+    demo = Path(__file__).parent / "demo.xlsx"
+    assert await sheet_names(demo) == ["Sheet1"]
+    headers = await read_headers(demo)
+    assert headers == ["Column1", "Column2\nMultiLines", "Column 3", 4]
+    assert headers == list((await read_excel(demo)).columns)
+    assert await read_headers(demo.read_bytes(), "Sheet1") == headers
+    assert await count_rows(demo) == len(await load_xls(demo)) == 2
+
+    # Workbook without dimension metadata
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("data")
+    for i in range(6):
+        ws.append([f"c{i}", i])
+    buf = BytesIO()
+    wb.save(buf)
+    assert await count_rows(buf.getvalue(), "data") == 5
+
+
+@pytest.mark.anyio
+async def test_load_columns():
+    demo = Path(__file__).parent / "demo.xlsx"
+    data = await load_xls(demo)
+    columns = ["Column 3", "Column1"]
+    assert await load_columns(demo, columns) == [
+        {c: row[c] for c in columns} for row in data
+    ]
+    assert await load_columns(demo, ["Column 3"], as_str=True) == [
+        {"Column 3": "1"},
+        {"Column 3": "2"},
+    ]
+    assert await load_columns(demo, []) == []
+    with pytest.raises(ParamsError):
+        await load_columns(demo, ["Column1", "x"])